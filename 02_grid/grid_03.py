@@ -1,3 +1,4 @@
+from array import array
 import csv
 import io
 import random
@@ -5,28 +6,31 @@ import sys
 
 
 class Grid:
-    """Store a grid of numbers."""
+    """Store a grid of numbers in a flat array."""
 
     def __init__(self, size):
         """Construct empty grid."""
         assert size > 0, f"Grid size must be positive not {size}"
         self.size = size
-        self.grid = [[0 for _ in range(size)] for _ in range(size)]
+        self.grid = array("l", [0]) * (size * size)
+
+    @property
+    def values(self):
+        """View grid as size X size without copying."""
+        return memoryview(self.grid).cast("B").cast("l", (self.size, self.size))
 
     def __getitem__(self, key):
         """Get grid element."""
-        x, y = key
-        return self.grid[x][y]
+        return self.grid[key[0] * self.size + key[1]]
 
     def __setitem__(self, key, value):
         """Set grid element."""
-        x, y = key
-        self.grid[x][y] = value
+        self.grid[key[0] * self.size + key[1]] = value
 
     def __str__(self):
         """Convert to string."""
         output = io.StringIO()
-        csv.writer(output).writerows(self.grid)
+        csv.writer(output).writerows(self.values.tolist())
         return output.getvalue()
 
 
@@ -1,32 +1,39 @@
 import argparse
+from array import array
 import csv
 import io
 import random
 
+# Moves in order of their trajectory codes.
+MOVES = [[-1, 0], [1, 0], [0, -1], [0, 1]]
+
 
 class Grid:
-    """Store a grid of numbers."""
+    """Store a grid of numbers in a flat array."""
 
     def __init__(self, size):
         """Construct empty grid."""
         assert size > 0, f"Grid size must be positive not {size}"
         self.size = size
-        self.grid = [[0 for _ in range(size)] for _ in range(size)]
+        self.grid = array("l", [0]) * (size * size)
+
+    @property
+    def values(self):
+        """View grid as size X size without copying."""
+        return memoryview(self.grid).cast("B").cast("l", (self.size, self.size))
 
     def __getitem__(self, key):
         """Get grid element."""
-        x, y = key
-        return self.grid[x][y]
+        return self.grid[key[0] * self.size + key[1]]
 
     def __setitem__(self, key, value):
         """Set grid element."""
-        x, y = key
-        self.grid[x][y] = value
+        self.grid[key[0] * self.size + key[1]] = value
 
     def __str__(self):
         """Convert to string."""
         output = io.StringIO()
-        csv.writer(output).writerows(self.grid)
+        csv.writer(output).writerows(self.values.tolist())
         return output.getvalue()
 
 
@@ -39,10 +46,47 @@ def cmdline_args():
     return parser.parse_args()
 
 
-def fill_grid(grid):
-    """Fill in a grid."""
+class Trajectory:
+    """Record moves as 2-bit codes packed four to a byte."""
+
+    def __init__(self):
+        """Construct empty trajectory."""
+        self.packed = bytearray()
+        self.length = 0
+
+    def __len__(self):
+        """Number of moves recorded."""
+        return self.length
+
+    def append(self, code):
+        """Record a single move."""
+        offset = self.length % 4
+        if offset == 0:
+            self.packed.append(code)
+        else:
+            self.packed[-1] |= code << (2 * offset)
+        self.length += 1
+
+    def codes(self, steps=None):
+        """Unpack the first `steps` codes (default all)."""
+        steps = self.length if steps is None else min(steps, self.length)
+        return [(self.packed[i // 4] >> (2 * (i % 4))) & 3 for i in range(steps)]
+
+    def replay(self, size, steps=None):
+        """Rebuild the grid left by the first `steps` moves (default all)."""
+        grid = Grid(size)
+        x = y = size // 2
+        for code in self.codes(steps):
+            grid[x, y] += 1
+            x += MOVES[code][0]
+            y += MOVES[code][1]
+        return grid
+
+
+def fill_grid(grid, trajectory=None):
+    """Fill in a grid, optionally recording moves in a trajectory."""
 
-    moves = [[-1, 0], [1, 0], [0, -1], [0, 1]]
+    moves = MOVES
     center = grid.size // 2
     size_1 = grid.size - 1
     x, y = center, center
@@ -52,6 +96,8 @@ def fill_grid(grid):
         grid[x, y] += 1
         num += 1
         m = random.choice(moves)
+        if trajectory is not None:
+            trajectory.append(moves.index(m))
         x += m[0]
         y += m[1]
 
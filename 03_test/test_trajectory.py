@@ -0,0 +1,24 @@
+import random
+import pytest
+from grid import Grid, Trajectory, fill_grid
+
+
+@pytest.mark.parametrize("seed", [123, 1234, 12345])
+def test_replay_rebuilds_grid(seed):
+    random.seed(seed)
+    fixture = Grid(11)
+    trajectory = Trajectory()
+    num = fill_grid(fixture, trajectory)
+    assert len(trajectory) == num
+    assert len(trajectory.packed) == (num + 3) // 4
+    assert str(trajectory.replay(11)) == str(fixture)
+
+
+def test_replay_prefix():
+    trajectory = Trajectory()
+    for code in [1, 1, 3, 0, 2]:
+        trajectory.append(code)
+    assert trajectory.codes(4) == [1, 1, 3, 0]
+    prefix = trajectory.replay(7, steps=3)
+    assert (prefix[3, 3], prefix[4, 3], prefix[5, 3]) == (1, 1, 1)
+    assert sum(sum(row) for row in prefix.values.tolist()) == 3
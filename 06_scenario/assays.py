@@ -36,7 +36,7 @@ class Assay(BaseModel):
     def _make_treatments(params):
         """Generate grid of treatments."""
 
-        grid = Grid(size=params.plate_size)
+        grid = Grid(size=params.plate_size, dtype="U1")
         for x in range(grid.size):
             for y in range(grid.size):
                 grid[x, y] = random.choice("CS")
@@ -46,7 +46,7 @@ class Assay(BaseModel):
     @staticmethod
     def _make_readings(params, specimen, treatments):
         """Make grid of readings."""
-        grid = Grid(size=params.plate_size)
+        grid = Grid(size=params.plate_size, dtype="float64")
         for x in range(grid.size):
             for y in range(grid.size):
                 if treatments[x, y] == "C":
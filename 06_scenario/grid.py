@@ -1,62 +1,263 @@
-from typing import ClassVar
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Annotated, ClassVar
+import base64
 import csv
 import io
-import random
-from pydantic import BaseModel, Field
+import json
+import numpy as np
+from pydantic import BaseModel, BeforeValidator, Field, PlainSerializer
 from utils import generic_id_generator
+from walks import ENGINES, seeded_rng, walk_batch
+
+
+def _decode_values(value, info):
+    """Rebuild grid values from an array, nested lists, or base64 bytes."""
+    if value is None:
+        return value
+    if ("size" not in info.data) or ("dtype" not in info.data):
+        raise ValueError("cannot check grid values without valid size and type")
+    size, dtype = info.data["size"], np.dtype(info.data["dtype"])
+    if isinstance(value, np.ndarray):
+        if value.shape != (size, size):
+            raise ValueError(f"grid shape {value.shape} is not ({size}, {size})")
+        if value.dtype.newbyteorder("=") != dtype.newbyteorder("="):
+            raise ValueError(f"grid values have type {value.dtype} not {dtype}")
+        return value
+    if isinstance(value, str):
+        raw = base64.b64decode(value)
+        values = np.frombuffer(raw, dtype=dtype.newbyteorder("<"))
+        return values.astype(dtype).reshape(size, size)
+    return np.array(value, dtype=dtype).reshape(size, size)
+
+
+# Binary formats and the suffixes of their data files.
+BINARY_FORMATS = {"npy": ".npy", "raw": ".bin"}
+
+
+def _encode_values(values):
+    """Serialize grid values as base64 little-endian bytes."""
+    raw = values.astype(values.dtype.newbyteorder("<"), copy=False).tobytes()
+    return base64.b64encode(raw).decode("ascii")
+
+
+GridValues = Annotated[
+    np.ndarray | None,
+    BeforeValidator(_decode_values),
+    PlainSerializer(_encode_values),
+]
 
 
 class Grid(BaseModel):
-    """Store a grid of numbers."""
+    """Store a grid of values in a contiguous NumPy array."""
+
+    model_config = {"arbitrary_types_allowed": True}
 
     id: str | None = Field(default=None, description="optional grid ID")
     size: int = Field(gt=0, description="grid size")
-    grid: list[list] = Field(default_factory=list, description="grid values")
+    dtype: str = Field(default="int64", description="NumPy type of grid values")
+    grid: GridValues = Field(default=None, description="grid values")
 
     def model_post_init(self, context):
-        self.grid = [[0 for _ in range(self.size)] for _ in range(self.size)]
+        if self.grid is None:
+            self.grid = np.zeros((self.size, self.size), dtype=self.dtype)
+
+    @property
+    def values(self):
+        """Grid values as a size X size array (not a copy)."""
+        return self.grid
+
+    def __eq__(self, other):
+        """Compare grids by ID, size, type, and values."""
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return (
+            (self.id == other.id)
+            and (self.size == other.size)
+            and (self.dtype == other.dtype)
+            and np.array_equal(self.grid, other.grid)
+        )
 
     def __getitem__(self, key):
         """Get grid element."""
-        x, y = key
-        return self.grid[x][y]
+        return self.grid[key]
 
     def __setitem__(self, key, value):
         """Set grid element."""
-        x, y = key
-        self.grid[x][y] = value
+        self.grid[key] = value
 
     def __str__(self):
         """Convert to string."""
         output = io.StringIO()
-        csv.writer(output).writerows(self.grid)
+        csv.writer(output).writerows(self.grid.tolist())
         return output.getvalue()
 
+    def add_counts(self, flat):
+        """Add one to the cell at each flat index `x * size + y`."""
+        np.add.at(self.grid.reshape(-1), flat, 1)
+
+    def rows(self):
+        """Generate rows of values from the top (largest Y) down."""
+        for y in range(self.size - 1, -1, -1):
+            yield self.grid[:, y].tolist()
+
     _id_generator: ClassVar = generic_id_generator(lambda i: f"G{i:02d}")
 
     @staticmethod
-    def generate(size):
-        """Make and fill in a grid."""
-        grid = Grid(id=next(Grid._id_generator), size=size)
-
-        moves = [[-1, 0], [1, 0], [0, -1], [0, 1]]
-        center = grid.size // 2
-        size_1 = grid.size - 1
-        x, y = center, center
-        num = 0
-
-        while (x != 0) and (y != 0) and (x != size_1) and (y != size_1):
-            grid[x, y] += 1
-            num += 1
-            m = random.choice(moves)
-            x += m[0]
-            y += m[1]
+    def generate(size, engine="python", sparse=False, trajectory=None):
+        """Make and fill in a grid using the named random walk engine.
 
+        If a `trajectory.Trajectory` is given, the walk's moves are
+        recorded in it so that the grid can be replayed later.
+        """
+        assert engine in ENGINES, f"Unknown walk engine {engine}"
+        cls = SparseGrid if sparse else Grid
+        grid = cls(id=next(Grid._id_generator), size=size)
+        ENGINES[engine](grid, trajectory=trajectory)
         return grid
 
+    @staticmethod
+    def generate_all(size, num, engine="python", sparse=False):
+        """Make and fill in several grids.
+
+        The "batch" engine advances all of the walks together; any other
+        engine fills the grids one at a time.
+        """
+        if engine != "batch":
+            return [Grid.generate(size, engine, sparse) for _ in range(num)]
+        cls = SparseGrid if sparse else Grid
+        grids = [cls(id=next(Grid._id_generator), size=size) for _ in range(num)]
+        walk_batch(grids)
+        return grids
+
+    @staticmethod
+    def generate_parallel(size, num, seed, engine="numpy", sparse=False, workers=1):
+        """Make and fill in several grids in a pool of worker processes.
+
+        Each grid gets its own random stream spawned from `seed` by a
+        `numpy.random.SeedSequence`, so the grids are the same whatever
+        the number of workers (including 1, which runs in-process).
+        """
+        assert engine in ENGINES, f"Unknown walk engine {engine}"
+        children = np.random.SeedSequence(seed).spawn(num)
+        jobs = [(size, engine, sparse, child) for child in children]
+        if workers == 1:
+            grids = [_fill_one(job) for job in jobs]
+        else:
+            chunksize = max(1, num // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                grids = list(pool.map(_fill_one, jobs, chunksize=chunksize))
+        for grid in grids:
+            grid.id = next(Grid._id_generator)
+        return grids
+
     @staticmethod
     def to_csv(writer, grid):
-        """Convert to CSV."""
-        for y in range(grid.size - 1, -1, -1):
-            row = [grid[x, y] for x in range(grid.size)]
-            writer.writerow(row)
+        """Convert to CSV one row at a time."""
+        writer.writerows(grid.rows())
+
+    def to_binary(self, stem, fmt="npy"):
+        """Save values in a binary format with a JSON sidecar.
+
+        Writes `stem.npy` (NumPy format) or `stem.bin` (raw bytes) with
+        values in little-endian order indexed as `[x, y]`, and
+        `stem.json` with the grid's ID, size, type, and format.
+        """
+        assert fmt in BINARY_FORMATS, f"Unknown grid format {fmt}"
+        stem = Path(stem)
+        values = self.grid.astype(self.grid.dtype.newbyteorder("<"), copy=False)
+        data = stem.with_suffix(BINARY_FORMATS[fmt])
+        if fmt == "npy":
+            np.save(data, values)
+        else:
+            values.tofile(data)
+        sidecar = {"id": self.id, "size": self.size, "dtype": self.dtype, "format": fmt}
+        stem.with_suffix(".json").write_text(json.dumps(sidecar) + "\n")
+
+    @staticmethod
+    def from_binary(stem, mmap=True):
+        """Load a grid saved by `to_binary`.
+
+        By default the values are memory-mapped read-only rather than
+        read into memory.
+        """
+        stem = Path(stem)
+        meta = json.loads(stem.with_suffix(".json").read_text())
+        data = stem.with_suffix(BINARY_FORMATS[meta["format"]])
+        dtype = np.dtype(meta["dtype"]).newbyteorder("<")
+        shape = (meta["size"], meta["size"])
+        if meta["format"] == "npy":
+            values = np.load(data, mmap_mode="r" if mmap else None)
+        elif mmap:
+            values = np.memmap(data, dtype=dtype, mode="r", shape=shape)
+        else:
+            values = np.fromfile(data, dtype=dtype).reshape(shape)
+        return Grid(id=meta["id"], size=meta["size"], dtype=meta["dtype"], grid=values)
+
+
+def _fill_one(job):
+    """Make and fill one grid from its own random stream (for process pools)."""
+    size, engine, sparse, seed_seq = job
+    grid = SparseGrid(size=size) if sparse else Grid(size=size)
+    ENGINES[engine](grid, seeded_rng(engine, seed_seq))
+    return grid
+
+
+class SparseGrid(BaseModel):
+    """Store only the non-zero cells of a grid of counts.
+
+    Cells are keyed by their flat index `x * size + y`, so a walk on a
+    very large grid only costs memory for the cells it visits.
+    """
+
+    id: str | None = Field(default=None, description="optional grid ID")
+    size: int = Field(gt=0, description="grid size")
+    cells: dict[int, int] = Field(
+        default_factory=dict, description="non-zero values by flat index"
+    )
+
+    def __getitem__(self, key):
+        """Get grid element."""
+        return self.cells.get(key[0] * self.size + key[1], 0)
+
+    def __setitem__(self, key, value):
+        """Set grid element."""
+        i = key[0] * self.size + key[1]
+        if value:
+            self.cells[i] = value
+        else:
+            self.cells.pop(i, None)
+
+    def add_counts(self, flat):
+        """Add one to the cell at each flat index `x * size + y`."""
+        cells = self.cells
+        indices, counts = np.unique(flat, return_counts=True)
+        for i, n in zip(indices.tolist(), counts.tolist()):
+            cells[i] = cells.get(i, 0) + n
+
+    def rows(self):
+        """Generate rows of values from the top (largest Y) down.
+
+        Only one row is expanded to its full width at a time.
+        """
+        by_row = defaultdict(list)
+        for i, value in self.cells.items():
+            x, y = divmod(i, self.size)
+            by_row[y].append((x, value))
+        for y in range(self.size - 1, -1, -1):
+            row = [0] * self.size
+            for x, value in by_row.pop(y, ()):
+                row[x] = value
+            yield row
+
+    def to_binary(self, stem, fmt="npy"):
+        """Save as a dense grid in a binary format (see `Grid.to_binary`)."""
+        self.to_dense().to_binary(stem, fmt)
+
+    def to_dense(self):
+        """Convert to a `Grid` with every cell allocated."""
+        grid = Grid(id=self.id, size=self.size)
+        flat = grid.values.reshape(-1)
+        flat[list(self.cells.keys())] = list(self.cells.values())
+        return grid
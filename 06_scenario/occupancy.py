@@ -0,0 +1,138 @@
+"""Expected occupancy of random-walk grids.
+
+The walk in `walks.py` starts at the center and moves to one of its
+four neighbors with equal probability until it reaches the edge, so
+the expected number of visits to each interior cell is the Green's
+function of that walk with absorbing boundaries. It satisfies
+
+    v - (sum of v over the four neighbors) / 4 = 1 at the center, 0 elsewhere
+
+with `v` zero on the edge. The operator on the left separates into
+one-dimensional second differences whose eigenvectors are sine waves,
+so it can be inverted directly with two matrix products instead of a
+general sparse solve.
+
+When the distribution itself is wanted, `Occupancy` accumulates the
+running mean and variance of visits per cell over many walks while
+only ever holding one walk's counts.
+"""
+
+import numpy as np
+from grid import Grid
+from walks import ENGINES
+
+
+def expected_grid(size, variance=False):
+    """Expected visits per cell for a walk on a grid of the given size.
+
+    Returns a `Grid` of floats, or a pair of grids (expectation and
+    variance) if `variance` is true. Both take O(size^3) time and
+    O(size^2) memory, because the expectation is two dense products of
+    (size - 2) X (size - 2) matrices; the variance needs the diagonal of
+    the Green's function as well, which takes two more products.
+    """
+    expected = Grid(size=size, dtype="float64")
+    if not variance:
+        result = expected
+    else:
+        spread = Grid(size=size, dtype="float64")
+        result = (expected, spread)
+
+    center = size // 2
+    if (center == 0) or (center == size - 1):
+        return result
+
+    modes, inverse = _spectrum(size - 2)
+    at_center = modes[center - 1]
+    green = modes @ (np.outer(at_center, at_center) * inverse) @ modes.T
+    expected.values[1:-1, 1:-1] = green
+
+    if variance:
+        # visits to j are 0 with probability 1 - G(c,j)/G(j,j) and otherwise
+        # geometric with mean G(j,j), so E[N^2] = G(c,j) (2 G(j,j) - 1)
+        squared = modes * modes
+        diagonal = squared @ inverse @ squared.T
+        spread.values[1:-1, 1:-1] = green * (2 * diagonal - 1) - green * green
+
+    return result
+
+
+def _spectrum(n):
+    """Sine modes on `n` interior points and inverse eigenvalues of the walk."""
+    k = np.arange(1, n + 1)
+    angles = np.pi * k / (n + 1)
+    modes = np.sqrt(2 / (n + 1)) * np.sin(np.outer(k, angles))
+    cosines = np.cos(angles)
+    inverse = 1 / (1 - (cosines[:, None] + cosines[None, :]) / 2)
+    return modes, inverse
+
+
+class Occupancy:
+    """Running mean and variance of visits per cell across many walks.
+
+    An `Occupancy` looks enough like a grid (`size`, indexing, and
+    `add_counts`) that any engine in `walks.py`, or `fill_grid` from
+    the testing chapter, can walk on it directly. After each walk,
+    `absorb` folds the counts into the statistics using Welford's
+    update and clears them for the next walk, so memory use does not
+    depend on the number of walks.
+    """
+
+    def __init__(self, size):
+        """Construct empty accumulator."""
+        assert size > 0, f"Grid size must be positive not {size}"
+        self.size = size
+        self.count = 0
+        self._visits = np.zeros((size, size), dtype=np.int64)
+        self._mean = np.zeros((size, size))
+        self._m2 = np.zeros((size, size))
+
+    @property
+    def values(self):
+        """Counts for the walk in progress (not a copy)."""
+        return self._visits
+
+    def __getitem__(self, key):
+        """Get count for the walk in progress."""
+        return self._visits[key]
+
+    def __setitem__(self, key, value):
+        """Set count for the walk in progress."""
+        self._visits[key] = value
+
+    def add_counts(self, flat):
+        """Add one to the cell at each flat index `x * size + y`."""
+        np.add.at(self._visits.reshape(-1), flat, 1)
+
+    def absorb(self, values=None):
+        """Fold one walk into the statistics.
+
+        With no argument, absorb the walk just taken on this accumulator
+        and reset its counts; otherwise absorb the given grid values
+        (an array or anything `np.asarray` accepts, such as `.values`).
+        """
+        current = self._visits if values is None else np.asarray(values)
+        self.count += 1
+        delta = current - self._mean
+        self._mean += delta / self.count
+        delta *= current - self._mean
+        self._m2 += delta
+        if values is None:
+            self._visits.fill(0)
+
+    def run(self, num, engine="python", rng=None):
+        """Take and absorb `num` walks using the named engine."""
+        assert engine in ENGINES, f"Unknown walk engine {engine}"
+        for _ in range(num):
+            ENGINES[engine](self, rng)
+            self.absorb()
+
+    def mean(self):
+        """Mean visits per cell as a float `Grid`."""
+        return Grid(size=self.size, dtype="float64", grid=self._mean.copy())
+
+    def variance(self, ddof=0):
+        """Variance of visits per cell as a float `Grid`."""
+        assert self.count > ddof, f"need more than {ddof} walks"
+        spread = self._m2 / (self.count - ddof)
+        return Grid(size=self.size, dtype="float64", grid=spread)
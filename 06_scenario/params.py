@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+from typing import Literal
+from pydantic import BaseModel, Field, model_validator
 
 
 DEFAULT_LOCALE = "et_EE"
@@ -44,6 +45,17 @@ class ScenarioParams(BaseModel):
 
     rng_seed: int = Field(required=True, description="random number generation seed")
     grid_size: int = Field(default=15, gt=0, description="sample grid size")
+    grid_engine: Literal["python", "numpy", "batch"] = Field(
+        default="python", description="random walk engine for sample grids"
+    )
+    sparse_grids: bool = Field(
+        default=False, description="only store visited cells of sample grids"
+    )
+    grid_workers: int = Field(
+        default=0,
+        ge=0,
+        description="processes for seeded grid generation (0 to use random)",
+    )
     num_sites: int = Field(default=3, gt=0, description="number of sample sites")
     num_specimens: int = Field(
         default=10, gt=0, description="total number of specimens"
@@ -56,3 +68,15 @@ class ScenarioParams(BaseModel):
         description="specimen generation parameters"
     )
     assay_params: AssayParams = Field(description="assay generation parameters")
+
+    @model_validator(mode="after")
+    def validate_model(self):
+        """Validate fields."""
+
+        if self.grid_workers and (self.grid_engine == "batch"):
+            raise ValueError(
+                "grid engine 'batch' cannot be used with grid_workers "
+                "(use 'python' or 'numpy')"
+            )
+
+        return self
@@ -7,7 +7,7 @@ import sys
 from pydantic import BaseModel, Field
 from params import AssayParams, SpecimenParams, ScenarioParams
 from assays import Assay
-from grid import Grid
+from grid import Grid, SparseGrid
 from machines import Machine
 from persons import Person
 from specimens import AllSpecimens
@@ -17,7 +17,9 @@ class Scenario(BaseModel):
     """Entire synthetic data scenario."""
 
     params: ScenarioParams = Field(description="scenario parameters")
-    grids: list[Grid] = Field(default_factory=list, description="sample site grids")
+    grids: list[Grid | SparseGrid] = Field(
+        default_factory=list, description="sample site grids"
+    )
     specimens: AllSpecimens = Field(description="all specimens")
     sampled: dict[str, tuple[str, tuple[int, int]]] = Field(
         default_factory=dict, description="where specimens taken"
@@ -31,7 +33,22 @@ class Scenario(BaseModel):
     @staticmethod
     def generate(params):
         """Generate entire scenario."""
-        grids = [Grid.generate(params.grid_size) for _ in range(params.num_sites)]
+        if params.grid_workers:
+            grids = Grid.generate_parallel(
+                params.grid_size,
+                params.num_sites,
+                params.rng_seed,
+                params.grid_engine,
+                params.sparse_grids,
+                params.grid_workers,
+            )
+        else:
+            grids = Grid.generate_all(
+                params.grid_size,
+                params.num_sites,
+                params.grid_engine,
+                params.sparse_grids,
+            )
         specimens = AllSpecimens.generate(params.specimen_params, params.num_specimens)
         machines = Machine.generate(params.num_machines)
         persons = Person.generate(params.locale, params.num_persons)
@@ -48,11 +65,12 @@ class Scenario(BaseModel):
                     )
                 )
 
+        sample = Scenario.sample_sparse if params.sparse_grids else Scenario.sample
         return Scenario(
             params=params,
             grids=grids,
             specimens=specimens,
-            sampled=Scenario.sample(params.grid_size, grids, specimens.samples),
+            sampled=sample(params.grid_size, grids, specimens.samples),
             machines=Machine.generate(params.num_machines),
             persons=Person.generate(params.locale, params.num_persons),
             assays=assays,
@@ -73,8 +91,24 @@ class Scenario(BaseModel):
             del coords[gid][loc]
         return result
 
-    def to_csv(self, root):
-        """Write to multi-CSV."""
+    @staticmethod
+    def sample_sparse(size, grids, specimens):
+        """Allocate specimens to grids without listing every cell."""
+        grid_ids = [g.id for g in grids]
+        taken = {g.id: set() for g in grids}
+        result = {}
+        for s in specimens:
+            gid = random.choice(grid_ids)
+            assert len(taken[gid]) < size * size, f"no free cells in {gid}"
+            loc = (random.randrange(size), random.randrange(size))
+            while loc in taken[gid]:
+                loc = (random.randrange(size), random.randrange(size))
+            taken[gid].add(loc)
+            result[s.id] = (gid, loc)
+        return result
+
+    def to_csv(self, root, grid_format="csv"):
+        """Write to multi-CSV, optionally with grids in a binary format."""
 
         root = Path(root)
         root.mkdir(exist_ok=True)
@@ -83,8 +117,11 @@ class Scenario(BaseModel):
         with open(root / "persons.csv", "w") as stream:
             Person.to_csv(csv.writer(stream), self.persons)
         for grid in self.grids:
-            with open(root / f"{grid.id}.csv", "w") as stream:
-                Grid.to_csv(csv.writer(stream), grid)
+            if grid_format == "csv":
+                with open(root / f"{grid.id}.csv", "w") as stream:
+                    Grid.to_csv(csv.writer(stream), grid)
+            else:
+                grid.to_binary(root / grid.id, grid_format)
         with open(root / "specimens.csv", "w") as stream:
             self.specimens.to_csv(csv.writer(stream))
         with open(root / "assays.csv", "w") as stream:
@@ -101,4 +138,4 @@ if __name__ == "__main__":
         rng_seed=91827364, specimen_params=SpecimenParams(), assay_params=AssayParams()
     )
     scenario = Scenario.generate(params)
-    scenario.to_csv(sys.argv[1])
+    scenario.to_csv(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else "csv")
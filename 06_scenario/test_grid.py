@@ -0,0 +1,129 @@
+import json
+import random
+import numpy as np
+import pytest
+from pydantic import TypeAdapter, ValidationError
+from grid import Grid, SparseGrid
+from params import AssayParams, ScenarioParams, SpecimenParams
+
+
+def test_values_is_view():
+    fixture = Grid(size=3)
+    fixture[1, 2] = 5
+    assert fixture.values[1, 2] == 5
+    fixture.values[2, 0] = 7
+    assert fixture[2, 0] == 7
+
+
+@pytest.mark.parametrize("dtype", ["int64", "int32", "float64", "U1"])
+def test_json_round_trip(dtype):
+    fixture = Grid(id="G99", size=4, dtype=dtype)
+    fixture[0, 3] = "C" if dtype == "U1" else 3
+    text = fixture.model_dump_json()
+    assert "[[" not in text
+    result = Grid.model_validate_json(text)
+    assert result.dtype == dtype
+    assert result == fixture
+
+
+def test_construct_from_nested_lists():
+    fixture = Grid(size=2, grid=[[1, 2], [3, 4]])
+    assert fixture[1, 0] == 3
+    assert str(fixture).split() == ["1,2", "3,4"]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"size": 0, "grid": [[1]]},
+        {"size": 3, "grid": np.zeros((2, 2), dtype="int64")},
+        {"size": 2, "grid": np.zeros((2, 2), dtype="float64")},
+    ],
+)
+def test_invalid_values_rejected(kwargs):
+    with pytest.raises(ValidationError):
+        Grid(**kwargs)
+
+
+def test_construct_from_array_of_declared_type():
+    values = np.arange(4, dtype="int32").reshape(2, 2)
+    fixture = Grid(size=2, dtype="int32", grid=values)
+    assert fixture.values is values
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_sparse_matches_dense(engine):
+    random.seed(4321)
+    dense = Grid.generate(21, engine)
+    random.seed(4321)
+    sparse = Grid.generate(21, engine, sparse=True)
+    assert isinstance(sparse, SparseGrid)
+    assert len(sparse.cells) == np.count_nonzero(dense.values)
+    assert list(sparse.rows()) == list(dense.rows())
+    assert sparse.to_dense().values.tolist() == dense.values.tolist()
+
+
+def test_sparse_setting_zero_removes_cell():
+    fixture = SparseGrid(size=1000)
+    fixture[999, 3] = 2
+    assert fixture[999, 3] == 2
+    fixture[999, 3] = 0
+    assert fixture.cells == {}
+
+
+def test_sparse_json_round_trip_in_scenario_union():
+    adapter = TypeAdapter(list[Grid | SparseGrid])
+    fixture = [Grid(id="G01", size=3), SparseGrid(id="G02", size=3, cells={4: 1})]
+    result = adapter.validate_json(adapter.dump_json(fixture))
+    assert [type(g) for g in result] == [Grid, SparseGrid]
+    assert result[1].cells == {4: 1}
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_parallel_same_whatever_number_of_workers(engine):
+    serial = Grid.generate_parallel(11, 6, 97531, engine, workers=1)
+    parallel = Grid.generate_parallel(11, 6, 97531, engine, workers=3)
+    assert [g.values.tolist() for g in serial] == [g.values.tolist() for g in parallel]
+    assert len({g.id for g in serial + parallel}) == 12
+
+
+def test_parallel_rejects_batch_engine():
+    kwargs = {
+        "rng_seed": 1,
+        "specimen_params": SpecimenParams(),
+        "assay_params": AssayParams(),
+    }
+    assert ScenarioParams(**kwargs, grid_engine="batch").grid_engine == "batch"
+    with pytest.raises(ValidationError, match="batch"):
+        ScenarioParams(**kwargs, grid_engine="batch", grid_workers=2)
+
+
+def test_parallel_sites_use_different_streams():
+    grids = Grid.generate_parallel(21, 4, 97531, sparse=True, workers=2)
+    assert len({tuple(sorted(g.cells.items())) for g in grids}) == 4
+
+
+@pytest.mark.parametrize("fmt", ["npy", "raw"])
+@pytest.mark.parametrize("mmap", [True, False])
+@pytest.mark.parametrize("dtype", ["int64", "float64"])
+def test_binary_round_trip(tmp_path, fmt, mmap, dtype):
+    fixture = Grid(id="G07", size=5, dtype=dtype)
+    fixture[1, 4] = 3
+    fixture[4, 0] = 2
+    fixture.to_binary(tmp_path / "G07", fmt)
+    assert json.loads((tmp_path / "G07.json").read_text()) == {
+        "id": "G07",
+        "size": 5,
+        "dtype": dtype,
+        "format": fmt,
+    }
+    result = Grid.from_binary(tmp_path / "G07", mmap=mmap)
+    assert result == fixture
+    assert list(result.rows()) == list(fixture.rows())
+
+
+def test_sparse_binary_is_dense(tmp_path):
+    fixture = SparseGrid(id="G08", size=4, cells={5: 2})
+    fixture.to_binary(tmp_path / "G08", "raw")
+    assert (tmp_path / "G08.bin").stat().st_size == 4 * 4 * 8
+    assert Grid.from_binary(tmp_path / "G08")[1, 1] == 2
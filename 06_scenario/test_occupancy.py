@@ -0,0 +1,83 @@
+import random
+import numpy as np
+import pytest
+from grid import Grid
+from occupancy import Occupancy, expected_grid
+from walks import walk_batch, walk_numpy
+
+
+def dense_green(size):
+    n = size - 2
+    interior = np.arange(n * n).reshape(n, n)
+    matrix = np.eye(n * n)
+    for a in range(n):
+        for b in range(n):
+            for da, db in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                if (0 <= a + da < n) and (0 <= b + db < n):
+                    matrix[interior[a, b], interior[a + da, b + db]] -= 0.25
+    return np.linalg.inv(matrix), interior
+
+
+@pytest.mark.parametrize("size", [5, 8, 11])
+def test_matches_dense_solve(size):
+    green, interior = dense_green(size)
+    c = interior[size // 2 - 1, size // 2 - 1]
+    expected, spread = expected_grid(size, variance=True)
+    diagonal = np.diag(green)[interior]
+    from_center = green[c][interior]
+    assert np.allclose(expected.values[1:-1, 1:-1], from_center)
+    assert np.allclose(
+        spread.values[1:-1, 1:-1],
+        from_center * (2 * diagonal - 1) - from_center**2,
+    )
+    assert expected.values[0, :].sum() == 0
+
+
+def test_matches_monte_carlo():
+    size = 9
+    num_trials = 20_000
+    grids = [Grid(size=size) for _ in range(num_trials)]
+    walk_batch(grids, np.random.default_rng(8642))
+    counts = np.stack([g.values for g in grids])
+    expected, spread = expected_grid(size, variance=True)
+    stderr = np.sqrt(spread.values / num_trials) + 1e-12
+    assert np.all(np.abs(counts.mean(axis=0) - expected.values) < 5 * stderr)
+    assert np.allclose(counts.var(axis=0), spread.values, rtol=0.2, atol=1e-12)
+
+
+def test_tiny_grid_is_empty():
+    assert expected_grid(2).values.sum() == 0
+
+
+def test_accumulator_matches_stored_grids():
+    rng = np.random.default_rng(97)
+    fixture = Occupancy(7)
+    stored = []
+    for _ in range(50):
+        walk_numpy(fixture, rng)
+        stored.append(fixture.values.copy())
+        fixture.absorb()
+    stored = np.stack(stored)
+    assert fixture.count == 50
+    assert fixture.values.sum() == 0
+    assert np.allclose(fixture.mean().values, stored.mean(axis=0))
+    assert np.allclose(fixture.variance(ddof=1).values, stored.var(axis=0, ddof=1))
+
+
+def test_accumulator_absorbs_existing_grids():
+    random.seed(24680)
+    grids = [Grid.generate(7) for _ in range(20)]
+    fixture = Occupancy(7)
+    for g in grids:
+        fixture.absorb(g.values)
+    stored = np.stack([g.values for g in grids])
+    assert np.allclose(fixture.mean().values, stored.mean(axis=0))
+    assert np.allclose(fixture.variance().values, stored.var(axis=0))
+
+
+def test_accumulator_converges_to_expectation():
+    fixture = Occupancy(9)
+    fixture.run(5000, "numpy", np.random.default_rng(1234))
+    expected, spread = expected_grid(9, variance=True)
+    stderr = np.sqrt(spread.values / fixture.count) + 1e-12
+    assert np.all(np.abs(fixture.mean().values - expected.values) < 5 * stderr)
@@ -0,0 +1,45 @@
+import random
+import numpy as np
+import pytest
+from grid import Grid
+from trajectory import Trajectory
+
+
+@pytest.mark.parametrize("sizes", [[1], [3, 5], [4, 4, 1], [7, 9, 2, 13]])
+def test_extend_and_append_pack_the_same(sizes):
+    codes = np.random.default_rng(11).integers(0, 4, size=sum(sizes))
+    one_at_a_time = Trajectory()
+    for c in codes.tolist():
+        one_at_a_time.append(c)
+    in_chunks = Trajectory()
+    start = 0
+    for n in sizes:
+        in_chunks.extend(codes[start : start + n])
+        start += n
+    assert in_chunks.packed == one_at_a_time.packed
+    assert len(in_chunks) == len(codes)
+    assert in_chunks.codes().tolist() == codes.tolist()
+    assert len(in_chunks.packed) == (len(codes) + 3) // 4
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_replay_rebuilds_grid(engine):
+    random.seed(3579)
+    fixture = Trajectory()
+    grid = Grid.generate(15, engine, trajectory=fixture)
+    assert len(fixture) == grid.values.sum()
+    assert np.array_equal(fixture.replay(15).values, grid.values)
+    copy = Trajectory(bytes(fixture.packed), len(fixture))
+    sparse = copy.replay(15, sparse=True)
+    assert sparse.to_dense().values.tolist() == grid.values.tolist()
+
+
+def test_replay_prefix():
+    fixture = Trajectory()
+    fixture.extend([1, 1, 3, 0])
+    assert fixture.replay(7, steps=0).values.sum() == 0
+    prefix = fixture.replay(7, steps=3)
+    assert prefix.values.sum() == 3
+    assert prefix[3, 3] == 1
+    assert prefix[4, 3] == 1
+    assert prefix[5, 3] == 1
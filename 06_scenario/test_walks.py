@@ -0,0 +1,91 @@
+import math
+import random
+import numpy as np
+import pytest
+from grid import Grid
+from walks import walk_batch, walk_numpy, walk_python
+
+
+@pytest.mark.parametrize("seed", [123, 1234, 12345])
+def test_numpy_edges_unfilled_and_sum_matches(seed):
+    fixture = Grid(size=9)
+    num = walk_numpy(fixture, np.random.default_rng(seed))
+    for p in (0, 8):
+        for q in range(9):
+            assert fixture[p, q] == 0
+            assert fixture[q, p] == 0
+    assert fixture.values.sum() == num
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 100, 4096])
+def test_numpy_reproducible_whatever_block_size(block_size):
+    expected = Grid(size=15)
+    walk_numpy(expected, np.random.default_rng(98765))
+    fixture = Grid(size=15)
+    walk_numpy(fixture, np.random.default_rng(98765), block_size=block_size)
+    assert np.array_equal(fixture.values, expected.values)
+
+
+def test_numpy_start_on_edge():
+    fixture = Grid(size=2)
+    assert walk_numpy(fixture, np.random.default_rng(1)) == 0
+
+
+def test_python_engine_unchanged():
+    random.seed(12345)
+    expected = Grid(size=11)
+    walk_python(expected)
+    random.seed(12345)
+    fixture = Grid.generate(11)
+    assert np.array_equal(fixture.values, expected.values)
+
+
+def test_engines_statistically_equivalent():
+    random.seed(12345)
+    rng = np.random.default_rng(12345)
+    num_trials = 2000
+    size = 11
+    center = size // 2
+
+    def sample(engine):
+        steps, centers = [], []
+        for _ in range(num_trials):
+            fixture = Grid(size=size)
+            steps.append(engine(fixture))
+            centers.append(fixture[center, center])
+        return np.array(steps), np.array(centers)
+
+    py_steps, py_centers = sample(walk_python)
+    np_steps, np_centers = sample(lambda g: walk_numpy(g, rng))
+
+    for left, right in ((py_steps, np_steps), (py_centers, np_centers)):
+        stderr = math.sqrt((left.var() + right.var()) / num_trials)
+        assert abs(left.mean() - right.mean()) < 4 * stderr
+
+
+def test_batch_edges_unfilled_and_sums_match():
+    fixtures = [Grid(size=9) for _ in range(20)]
+    nums = walk_batch(fixtures, np.random.default_rng(2468))
+    for fixture, num in zip(fixtures, nums):
+        assert fixture.values[[0, 8], :].sum() == 0
+        assert fixture.values[:, [0, 8]].sum() == 0
+        assert fixture.values.sum() == num
+
+
+def test_batch_reproducible():
+    first = [Grid(size=11) for _ in range(5)]
+    walk_batch(first, np.random.default_rng(1357))
+    second = [Grid(size=11) for _ in range(5)]
+    walk_batch(second, np.random.default_rng(1357))
+    assert all(np.array_equal(a.values, b.values) for a, b in zip(first, second))
+
+
+def test_batch_statistically_equivalent():
+    random.seed(12345)
+    num_trials = 2000
+    size = 11
+    py_steps = np.array([walk_python(Grid(size=size)) for _ in range(num_trials)])
+    batch = [Grid(size=size) for _ in range(num_trials)]
+    batch_steps = walk_batch(batch, np.random.default_rng(12345), block_size=16)
+    stderr = math.sqrt((py_steps.var() + batch_steps.var()) / num_trials)
+    assert abs(py_steps.mean() - batch_steps.mean()) < 4 * stderr
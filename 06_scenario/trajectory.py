@@ -0,0 +1,71 @@
+"""Compact recording and replay of random walks."""
+
+import numpy as np
+from grid import Grid, SparseGrid
+from walks import DX, DY
+
+# Bit offsets of the four codes packed into each byte.
+SHIFTS = np.array([0, 2, 4, 6], dtype=np.uint8)
+
+
+class Trajectory:
+    """Record the moves of a walk as 2-bit codes packed four to a byte.
+
+    Codes are indices into `walks.MOVES`. The first move of a walk is
+    stored in the lowest two bits of the first byte.
+    """
+
+    def __init__(self, packed=b"", length=0):
+        """Construct from previously packed codes (or empty)."""
+        assert 0 <= length <= 4 * len(packed), f"invalid length {length}"
+        self._packed = bytearray(packed)
+        self._length = length
+
+    def __len__(self):
+        """Number of moves recorded."""
+        return self._length
+
+    @property
+    def packed(self):
+        """Packed codes (not a copy)."""
+        return self._packed
+
+    def append(self, code):
+        """Record a single move."""
+        offset = self._length % 4
+        if offset == 0:
+            self._packed.append(code)
+        else:
+            self._packed[-1] |= code << (2 * offset)
+        self._length += 1
+
+    def extend(self, codes):
+        """Record an array of moves."""
+        codes = np.asarray(codes, dtype=np.uint8)
+        head = min(len(codes), -self._length % 4)
+        for code in codes[:head].tolist():
+            self.append(code)
+        codes = codes[head:]
+        whole = len(codes) - len(codes) % 4
+        packed = np.bitwise_or.reduce(codes[:whole].reshape(-1, 4) << SHIFTS, axis=1)
+        self._packed.extend(packed.tobytes())
+        self._length += whole
+        for code in codes[whole:].tolist():
+            self.append(code)
+
+    def codes(self, steps=None):
+        """Unpack the first `steps` codes (default all) as a uint8 array."""
+        steps = self._length if steps is None else min(steps, self._length)
+        raw = np.frombuffer(self._packed, dtype=np.uint8, count=(steps + 3) // 4)
+        return ((raw[:, None] >> SHIFTS) & 3).reshape(-1)[:steps]
+
+    def replay(self, size, steps=None, sparse=False):
+        """Rebuild the grid left by the first `steps` moves (default all)."""
+        codes = self.codes(steps)
+        grid = SparseGrid(size=size) if sparse else Grid(size=size)
+        if len(codes):
+            center = size // 2
+            xs = center + np.concatenate(([0], np.cumsum(DX[codes[:-1]])))
+            ys = center + np.concatenate(([0], np.cumsum(DY[codes[:-1]])))
+            grid.add_counts(xs * size + ys)
+        return grid
@@ -0,0 +1,149 @@
+"""Random walk engines for filling grids.
+
+Each engine walks from the center of a grid to its edge, adding one
+to each interior cell every time the walk lands on it, and returns
+the number of steps taken.
+
+The pure-Python engine takes one step at a time using `random.choice`.
+The NumPy engine draws `block_size` steps at once from a
+`numpy.random.Generator`, finds where the walk leaves the interior
+with `cumsum` and a boundary mask, and accumulates visit counts with
+the grid's `add_counts` method (`np.add.at` for dense grids). Its
+reproducibility contract is that the grid depends only on the seed
+of the generator: the same seed produces the same grid on every run,
+whatever the block size. The two engines do not
+produce the same grid for the same seed, but they sample the same
+distribution of walks.
+"""
+
+import random
+import numpy as np
+
+
+# Moves in order of their codes.
+MOVES = [[-1, 0], [1, 0], [0, -1], [0, 1]]
+DX = np.array([m[0] for m in MOVES])
+DY = np.array([m[1] for m in MOVES])
+
+# Number of steps drawn at a time by the NumPy engine.
+BLOCK_SIZE = 4096
+
+# Number of steps drawn at a time for each walker by the batched engine.
+BATCH_BLOCK_SIZE = 256
+
+
+def walk_python(grid, rng=None, trajectory=None):
+    """Fill grid one step at a time, optionally recording the moves."""
+    rng = random if rng is None else rng
+    moves = MOVES
+    center = grid.size // 2
+    size_1 = grid.size - 1
+    x, y = center, center
+    num = 0
+
+    while (x != 0) and (y != 0) and (x != size_1) and (y != size_1):
+        grid[x, y] += 1
+        num += 1
+        m = rng.choice(moves)
+        if trajectory is not None:
+            trajectory.append(moves.index(m))
+        x += m[0]
+        y += m[1]
+
+    return num
+
+
+def walk_numpy(grid, rng=None, block_size=BLOCK_SIZE, trajectory=None):
+    """Fill grid a block of steps at a time, optionally recording the moves.
+
+    If no generator is given, one is seeded from the `random` module
+    so that seeding `random` still makes the walk reproducible.
+    """
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    size = grid.size
+    size_1 = size - 1
+    x = y = size // 2
+    num = 0
+
+    while (x != 0) and (y != 0) and (x != size_1) and (y != size_1):
+        codes = rng.integers(0, len(MOVES), size=block_size)
+        xs = x + np.cumsum(DX[codes])
+        ys = y + np.cumsum(DY[codes])
+        edge = (xs == 0) | (ys == 0) | (xs == size_1) | (ys == size_1)
+        stop = int(edge.argmax()) if edge.any() else block_size - 1
+
+        # cells occupied before each step up to and including the exit step
+        flat = np.empty(stop + 1, dtype=np.int64)
+        flat[0] = x * size + y
+        flat[1:] = xs[:stop] * size + ys[:stop]
+        grid.add_counts(flat)
+        if trajectory is not None:
+            trajectory.extend(codes[: stop + 1])
+        num += stop + 1
+        x, y = int(xs[stop]), int(ys[stop])
+
+    return num
+
+
+def walk_batch(grids, rng=None, block_size=BATCH_BLOCK_SIZE):
+    """Fill several grids of the same size with walks taken in lock-step.
+
+    Every active walker takes `block_size` steps per round, and walkers
+    are retired as soon as they reach the edge. Returns an array with
+    the number of steps taken on each grid. The result depends on the
+    generator's seed, the number of grids, and the block size.
+    """
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    size = grids[0].size
+    assert all(g.size == size for g in grids), "grids must be the same size"
+    size_1 = size - 1
+    center = size // 2
+    num = np.zeros(len(grids), dtype=np.int64)
+    if (center == 0) or (center == size_1):
+        return num
+
+    active = np.arange(len(grids))
+    x = np.full(len(grids), center)
+    y = np.full(len(grids), center)
+    cols = np.arange(block_size)
+
+    while len(active):
+        codes = rng.integers(0, len(MOVES), size=(len(active), block_size))
+        xs = x[:, None] + np.cumsum(DX[codes], axis=1)
+        ys = y[:, None] + np.cumsum(DY[codes], axis=1)
+        edge = (xs == 0) | (ys == 0) | (xs == size_1) | (ys == size_1)
+        done = edge.any(axis=1)
+        stop = np.where(done, edge.argmax(axis=1), block_size - 1)
+
+        # cells occupied before each step up to and including the exit step
+        occupied = np.empty((len(active), block_size), dtype=np.int64)
+        occupied[:, 0] = x * size + y
+        occupied[:, 1:] = xs[:, :-1] * size + ys[:, :-1]
+        lengths = stop + 1
+        flat = occupied[cols[None, :] < lengths[:, None]]
+        for i, part in zip(active, np.split(flat, np.cumsum(lengths)[:-1])):
+            grids[i].add_counts(part)
+        num[active] += lengths
+
+        rows = np.arange(len(active))
+        x, y = xs[rows, stop], ys[rows, stop]
+        keep = ~done
+        active, x, y = active[keep], x[keep], y[keep]
+
+    return num
+
+
+def seeded_rng(engine, seed_seq):
+    """Make a generator for an engine from a `numpy.random.SeedSequence`."""
+    if engine == "python":
+        state = seed_seq.generate_state(4, dtype=np.uint64)
+        return random.Random(int.from_bytes(state.tobytes(), "little"))
+    return np.random.default_rng(seed_seq)
+
+
+ENGINES = {
+    "python": walk_python,
+    "numpy": walk_numpy,
+}
@@ -0,0 +1,227 @@
+"""Benchmark the random-walk grid implementations.
+
+Every registered variant is run for each combination of size and
+seed, repeating each run and keeping the fastest time. The results
+(steps per second, wall time, and peak memory) are written as JSON and
+optionally compared against a baseline file, in which case the exit
+status is 1 if any variant is slower than the baseline by more than
+the threshold. Speeds are only comparable on the same machine, so
+regenerate the baseline with `--output` when moving to new hardware.
+
+To add an engine, write a function that takes a grid size and a seed,
+fills one grid, and returns the number of steps taken, then decorate
+it with `@register("name")`.
+"""
+
+import argparse
+import contextlib
+import functools
+import importlib.util
+import io
+import json
+import os
+import platform
+import random
+import runpy
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SIZES = [51, 101, 201]
+SEEDS = [1, 2, 3, 4, 5]
+REPEATS = 5
+THRESHOLD = 0.3
+
+# Registered variants: name -> (function, fixed sizes or None).
+VARIANTS = {}
+
+
+def register(name, sizes=None):
+    """Register a benchmark variant, optionally limited to certain sizes."""
+
+    def _decorate(func):
+        assert name not in VARIANTS, f"duplicate variant {name}"
+        VARIANTS[name] = (func, sizes)
+        return func
+
+    return _decorate
+
+
+@functools.cache
+def load(path, name):
+    """Import a module from a file under a unique name (once)."""
+    spec = importlib.util.spec_from_file_location(name, ROOT / path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@register("02_grid/grid_01", sizes=[11])
+def run_grid_01(size, seed):
+    """Script with a hard-coded size, so only run at that size."""
+    random.seed(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = runpy.run_path(str(ROOT / "02_grid" / "grid_01.py"))
+    assert result["size"] == size
+    return sum(sum(row) for row in result["grid"])
+
+
+@register("02_grid/grid_02")
+def run_grid_02(size, seed):
+    """Function that fills a list of lists."""
+    module = load("02_grid/grid_02.py", "bench_grid_02")
+    random.seed(seed)
+    return sum(sum(row) for row in module.make_grid(size))
+
+
+@register("02_grid/grid_03")
+def run_grid_03(size, seed):
+    """Class backed by a flat array."""
+    module = load("02_grid/grid_03.py", "bench_grid_03")
+    random.seed(seed)
+    grid = module.Grid(size)
+    module.fill_grid(grid)
+    return sum(grid.grid)
+
+
+@register("02_grid/grid_04")
+def run_grid_04(size, seed):
+    """Class backed by a list of lists."""
+    module = load("02_grid/grid_04.py", "bench_grid_04")
+    random.seed(seed)
+    grid = module.Grid(size)
+    module.fill_grid(grid)
+    return sum(sum(row) for row in grid.grid)
+
+
+@register("03_test/grid")
+def run_test_grid(size, seed):
+    """Tested class that counts its own steps."""
+    module = load("03_test/grid.py", "bench_test_grid")
+    random.seed(seed)
+    return module.fill_grid(module.Grid(size))
+
+
+def scenario_engine(engine):
+    """Make a variant that runs one of the scenario's walk engines."""
+
+    def _run(size, seed):
+        sys.path.insert(0, str(ROOT / "06_scenario"))
+        try:
+            from grid import Grid
+        finally:
+            sys.path.pop(0)
+        random.seed(seed)
+        return int(Grid.generate(size, engine).values.sum())
+
+    return _run
+
+
+for _engine in ("python", "numpy"):
+    register(f"06_scenario/{_engine}")(scenario_engine(_engine))
+
+
+def main():
+    """Main driver."""
+    args = cmdline_args()
+    names = args.variants or list(VARIANTS)
+    for name in names:
+        assert name in VARIANTS, f"unknown variant {name}"
+    results = [
+        measure(name, size, args.seeds, args.repeats)
+        for name in names
+        for size in (VARIANTS[name][1] or args.sizes)
+    ]
+    report = {"machine": machine(), "results": results}
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        failures = compare(results, baseline["results"], args.threshold)
+        for message in failures:
+            print(message, file=sys.stderr)
+        return 1 if failures else 0
+    return 0
+
+
+def cmdline_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--baseline", type=str, help="compare to this file")
+    parser.add_argument("--output", type=str, required=True, help="results file")
+    parser.add_argument("--repeats", type=int, default=REPEATS, help="runs per seed")
+    parser.add_argument("--seeds", type=int, nargs="+", default=SEEDS, help="seeds")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="sizes")
+    parser.add_argument(
+        "--threshold", type=float, default=THRESHOLD, help="allowed slowdown"
+    )
+    parser.add_argument("--variants", nargs="+", help="variants to run (default all)")
+    return parser.parse_args()
+
+
+def measure(name, size, seeds, repeats):
+    """Run one variant at one size for all seeds."""
+    func = VARIANTS[name][0]
+    func(size, seeds[0])  # warm up imports and caches
+
+    steps, elapsed = 0, 0.0
+    for seed in seeds:
+        fastest = None
+        for _ in range(repeats):
+            start = time.perf_counter()
+            num = func(size, seed)
+            duration = time.perf_counter() - start
+            fastest = duration if fastest is None else min(fastest, duration)
+        steps += num
+        elapsed += fastest
+
+    peak = 0
+    for seed in seeds:
+        tracemalloc.start()
+        func(size, seed)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    return {
+        "variant": name,
+        "size": size,
+        "seeds": list(seeds),
+        "repeats": repeats,
+        "steps": steps,
+        "wall_time": elapsed,
+        "steps_per_sec": steps / elapsed if elapsed else None,
+        "peak_bytes": peak,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Report variants that have slowed down by more than the threshold."""
+    previous = {(r["variant"], r["size"]): r for r in baseline}
+    failures = []
+    for r in results:
+        old = previous.get((r["variant"], r["size"]))
+        if (old is None) or (not old["steps_per_sec"]) or (not r["steps_per_sec"]):
+            continue
+        ratio = r["steps_per_sec"] / old["steps_per_sec"]
+        if ratio < 1 - threshold:
+            failures.append(
+                f"{r['variant']} size {r['size']}: {ratio:.2f} of baseline speed"
+            )
+    return failures
+
+
+def machine():
+    """Describe the machine the benchmarks ran on."""
+    return {
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Record and check digests of golden invasion percolation runs."""
+
+import json
+import sys
+
+from invperc_util import initialize_grid, initialize_random
+from params_single import ParamsSingle
+
+GOLDEN = "golden.json"
+KINDS = ["lazy", "list", "array", "heap", "heap_float"]
+SIZES = [15, 25]
+DEPTHS = [2, 10]
+SEEDS = [1, 2]
+
+
+def main():
+    """Write golden digests, or check against them with `check`."""
+    if (len(sys.argv) > 1) and (sys.argv[1] == "check"):
+        failures = check(load_golden())
+        for message in failures:
+            print(message, file=sys.stderr)
+        return 1 if failures else 0
+    save_golden(record())
+    return 0
+
+
+def cases():
+    """Generate (kind, size, depth, seed) for every golden run."""
+    for kind in KINDS:
+        for size in SIZES:
+            for depth in DEPTHS:
+                for seed in SEEDS:
+                    yield kind, size, depth, seed
+
+
+def run(kind, size, depth, seed):
+    """Fill one grid and return its digest."""
+    params = ParamsSingle(kind, size, size, depth, seed)
+    initialize_random(params)
+    grid = initialize_grid(params)
+    grid.fill()
+    return grid.digest()
+
+
+def record():
+    """Run every case and return golden records."""
+    return [
+        {"kind": kind, "size": size, "depth": depth, "seed": seed, "digest": digest}
+        for (kind, size, depth, seed) in cases()
+        for digest in [run(kind, size, depth, seed)]
+    ]
+
+
+def check(golden):
+    """Re-run each golden case and report mismatches."""
+    failures = []
+    for entry in golden:
+        key = (entry["kind"], entry["size"], entry["depth"], entry["seed"])
+        if run(*key) != entry["digest"]:
+            failures.append(f"digest mismatch for {key}")
+    return failures
+
+
+def load_golden(filename=GOLDEN):
+    """Load golden records."""
+    with open(filename, "r") as reader:
+        return json.load(reader)
+
+
+def save_golden(golden, filename=GOLDEN):
+    """Save golden records."""
+    with open(filename, "w") as writer:
+        json.dump(golden, writer, indent=4)
+        writer.write("\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
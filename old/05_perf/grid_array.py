@@ -6,15 +6,22 @@ from grid_generic import GridGeneric
 
 
 class GridArray(GridGeneric):
-    """Represent grid as NumPy array."""
+    """Represent grid as NumPy array.
 
-    def __init__(self, width, height, depth):
+    By default the values are exactly those that calling
+    `random.randint(1, depth)` for each cell in turn would produce, and
+    `random` is left in the same state, so results match the original
+    cell-by-cell version for the same seed. Pass `init="numpy"` to draw
+    them with a NumPy generator (seeded from `random`) instead, which
+    is faster but gives different grids. Pass a `random.Random` object
+    as `rng` to use it instead of the `random` module.
+    """
+
+    def __init__(self, width, height, depth, init="legacy", rng=random):
         """Construct and fill."""
         super().__init__(width, height, depth)
-        self._grid = np.zeros((width, height), dtype=int)
-        for x in range(self.width()):
-            for y in range(self.height()):
-                self[x, y] = random.randint(1, depth)
+        assert init in INITIALIZERS, f"Unknown initializer {init}"
+        self._grid = INITIALIZERS[init](width, height, depth, rng)
 
     def __getitem__(self, key):
         """Get value at location."""
@@ -23,3 +30,51 @@ class GridArray(GridGeneric):
     def __setitem__(self, key, value):
         """Set value at location."""
         self._grid[*key] = value
+
+    def to_array(self):
+        """Get values as a NumPy array indexed by `[x, y]` (not a copy)."""
+        return self._grid
+
+
+def legacy_values(width, height, depth, rng=random):
+    """Draw the values `random.randint` would, all at once.
+
+    `randint` takes the top `depth.bit_length()` bits of the next 32-bit
+    word from the generator and tries again if the result is too large.
+    `getrandbits(32 * n)` packs the next `n` words into one integer, so
+    we draw a block of words, filter them all at once, then rewind and
+    skip exactly as many words as the loop would have used.
+    """
+    count = width * height
+    bits = depth.bit_length()
+    if (count == 0) or (bits > 32):
+        values = [rng.randint(1, depth) for _ in range(count)]
+        return np.array(values, dtype=int).reshape(width, height)
+
+    state = rng.getstate()
+    num_words = count + count // 2 + 16
+    while True:
+        packed = rng.getrandbits(32 * num_words)
+        words = np.frombuffer(packed.to_bytes(4 * num_words, "little"), dtype="<u4")
+        draws = words >> (32 - bits)
+        accepted = np.flatnonzero(draws < depth)
+        if len(accepted) >= count:
+            break
+        rng.setstate(state)
+        num_words *= 2
+
+    rng.setstate(state)
+    rng.getrandbits(32 * (int(accepted[count - 1]) + 1))
+    return (1 + draws[accepted[:count]].astype(int)).reshape(width, height)
+
+
+def numpy_values(width, height, depth, rng=random):
+    """Draw values in one call to a NumPy generator seeded from `rng`."""
+    generator = np.random.default_rng(rng.getrandbits(64))
+    return generator.integers(1, depth + 1, size=(width, height))
+
+
+INITIALIZERS = {
+    "legacy": legacy_values,
+    "numpy": numpy_values,
+}
@@ -1,7 +1,10 @@
 """Represent 2D grid."""
 
+import hashlib
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class GridGeneric(ABC):
     """Represent a generic grid."""
@@ -26,11 +29,27 @@ class GridGeneric(ABC):
             return False
         if self.height() != other.height():
             return False
-        for x in range(self.width()):
-            for y in range(self.height()):
-                if self[x, y] != other[x, y]:
-                    return False
-        return True
+        return np.array_equal(self.to_array(), other.to_array())
+
+    def to_array(self):
+        """Get values as a NumPy array indexed by `[x, y]`."""
+        return np.array(
+            [[self[x, y] for y in range(self.height())] for x in range(self.width())]
+        )
+
+    def digest(self):
+        """SHA-256 of the grid's shape and values.
+
+        Integer and real values are hashed as little-endian 64-bit
+        numbers so that grids with the same contents have the same
+        digest whichever class and platform produced them.
+        """
+        values = self.to_array()
+        dtype = "<f8" if values.dtype.kind == "f" else "<i8"
+        buffer = np.ascontiguousarray(values, dtype=dtype)
+        result = hashlib.sha256(f"{dtype}:{self.width()}x{self.height()}:".encode())
+        result.update(buffer.tobytes())
+        return result.hexdigest()
 
     def width(self):
         """Get width of grid."""
@@ -0,0 +1,62 @@
+"""Lazy-filling grid with a heap of candidates."""
+
+import heapq
+import random
+
+from grid_generic import GridGeneric
+from grid_lazy import GridLazy
+
+
+class GridHeap(GridLazy):
+    """Keep candidate cells in a binary heap.
+
+    `GridLazy` searches the keys of its candidate dictionary on every
+    step, which is fine for small depths but slow when there are many
+    distinct values. Here each candidate is pushed once as a tuple
+    `(value, tiebreak, x, y)`, where `tiebreak` is a random number, so
+    the lowest-valued cell is always on top of the heap and cells with
+    equal values come off in random order.
+    """
+
+    def __init__(self, width, height, depth, rng=random):
+        """Construct and fill."""
+        super().__init__(width, height, depth, rng)
+        self._candidates = []
+        self._queued = set()
+
+    def choose_cell(self):
+        """Choose the next cell to fill."""
+        _, _, x, y = heapq.heappop(self._candidates)
+        self.add_candidates(x, y)
+        return x, y
+
+    def add_one_candidate(self, x, y):
+        """Add (x, y) if suitable."""
+        if (x < 0) or (x >= self.width()) or (y < 0) or (y >= self.height()):
+            return
+        if self[x, y] == 0:
+            return
+        if (x, y) in self._queued:
+            return
+
+        self._queued.add((x, y))
+        heapq.heappush(self._candidates, (self[x, y], self._rng.random(), x, y))
+
+
+class GridHeapFloat(GridHeap):
+    """Heap-based grid with real values in (0, depth].
+
+    The constructor skips `GridList.__init__`, which would draw an
+    integer for every cell only to have it replaced.
+    """
+
+    def __init__(self, width, height, depth, rng=random):
+        """Construct and fill."""
+        GridGeneric.__init__(self, width, height, depth)
+        self._rng = rng
+        self._grid = [
+            [depth * (1.0 - rng.random()) for y in range(height)]
+            for x in range(width)
+        ]
+        self._candidates = []
+        self._queued = set()
@@ -9,9 +9,9 @@ class GridLazy(GridList):
     """Only look at cells that might actually be filled next time."""
 
     # [init]
-    def __init__(self, width, height, depth):
+    def __init__(self, width, height, depth, rng=random):
         """Construct and fill."""
-        super().__init__(width, height, depth)
+        super().__init__(width, height, depth, rng)
         self._candidates = {}
     # [/init]
 
@@ -37,7 +37,7 @@ class GridLazy(GridList):
         """Choose the next cell to fill."""
         min_key = min(self._candidates.keys())
         available = list(sorted(self._candidates[min_key]))
-        i = random.randrange(len(available))
+        i = self._rng.randrange(len(available))
         choice = available[i]
         del available[i]
         if not available:
@@ -0,0 +1,178 @@
+"""Benchmark invasion percolation fills over a parameter sweep.
+
+Grids are constructed outside the timed region, so only `fill` is
+measured. Each configuration from `generate_sweep` gets some untimed
+warmup fills, then each run's grid is rebuilt from the same saved
+`random` state and filled several times using `perf_counter_ns`, and
+the fastest of those fills is that grid's time. Finally, one more run
+under `tracemalloc` finds peak memory (which is kept separate because
+tracing slows everything down). Some kinds use random numbers while
+filling, so the generator is reseeded after the warmup and its state
+is restored after each timed fill: every configuration therefore
+fills the same sequence of grids from the sweep's seed. Per-grid
+times are summarized by median and interquartile range and saved as
+JSON along with a description of the machine. If a baseline is given,
+the exit status is 1 when any configuration's median is slower than
+the baseline's by more than the threshold.
+"""
+
+import argparse
+import dataclasses
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from invperc_sweep import generate_sweep
+from invperc_util import get_params, initialize_grid, initialize_random
+from params_sweep import ParamsSweep
+
+WARMUP = 2
+REPEATS = 5
+THRESHOLD = 0.25
+
+
+def main():
+    """Main driver."""
+    args = cmdline_args()
+    params = get_params(args.params, ParamsSweep)
+    initialize_random(params)
+    results = [
+        measure(params.seed, list(group), args.warmup, args.repeats)
+        for _, group in itertools.groupby(generate_sweep(params), key=config)
+    ]
+    report = {
+        "machine": machine(),
+        "params": dataclasses.asdict(params),
+        "warmup": args.warmup,
+        "repeats": args.repeats,
+        "results": results,
+    }
+    with open(args.output, "w") as writer:
+        json.dump(report, writer, indent=4)
+        writer.write("\n")
+    if args.baseline is None:
+        return 0
+    with open(args.baseline, "r") as reader:
+        baseline = json.load(reader)
+    failures = compare(results, baseline["results"], args.threshold)
+    for message in failures:
+        print(message, file=sys.stderr)
+    return 1 if failures else 0
+
+
+def cmdline_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("params", help="sweep parameters (JSON)")
+    parser.add_argument("output", help="results file (JSON)")
+    parser.add_argument("--baseline", help="compare to this results file")
+    parser.add_argument(
+        "--threshold", type=float, default=THRESHOLD, help="allowed slowdown"
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=REPEATS, help="timed fills per grid"
+    )
+    parser.add_argument("--warmup", type=int, default=WARMUP, help="untimed fills")
+    return parser.parse_args()
+
+
+def config(params):
+    """Key identifying a single configuration in a sweep."""
+    return (params.kind, params.width, params.height, params.depth)
+
+
+def measure(seed, runs, warmup, repeats=REPEATS):
+    """Time and trace the runs of one configuration."""
+    assert repeats > 0, f"Invalid number of repeats {repeats}"
+    random.seed(seed)
+    for _ in range(warmup):
+        initialize_grid(runs[0]).fill()
+
+    random.seed(seed)
+    times, filled = [], []
+    for params in runs:
+        before = random.getstate()
+        fastest = None
+        for _ in range(repeats):
+            random.setstate(before)
+            grid = initialize_grid(params)
+            after = random.getstate()
+            start = time.perf_counter_ns()
+            num_filled = grid.fill()
+            elapsed = time.perf_counter_ns() - start
+            fastest = elapsed if fastest is None else min(fastest, elapsed)
+            random.setstate(after)
+        times.append(fastest)
+        filled.append(num_filled)
+
+    random.seed(seed)
+    tracemalloc.start()
+    initialize_grid(runs[0]).fill()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    kind, width, height, depth = config(runs[0])
+    return {
+        "kind": kind,
+        "width": width,
+        "height": height,
+        "depth": depth,
+        "runs": len(runs),
+        "repeats": repeats,
+        "num_filled": statistics.median(filled),
+        "peak_bytes": peak,
+        **summarize(times),
+    }
+
+
+def summarize(times):
+    """Median, interquartile range, and extremes of times in nanoseconds."""
+    if len(times) > 1:
+        q1, median, q3 = statistics.quantiles(times, n=4, method="inclusive")
+    else:
+        q1 = median = q3 = times[0]
+    return {
+        "median_ns": median,
+        "iqr_ns": q3 - q1,
+        "min_ns": min(times),
+        "max_ns": max(times),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Report configurations that have slowed down by more than the threshold."""
+    key = ("kind", "width", "height", "depth")
+    previous = {tuple(r[k] for k in key): r for r in baseline}
+    failures = []
+    for r in results:
+        old = previous.get(tuple(r[k] for k in key))
+        if (old is None) or (not old["median_ns"]):
+            continue
+        ratio = r["median_ns"] / old["median_ns"]
+        if ratio > 1 + threshold:
+            failures.append(
+                f"{r['kind']} {r['width']}x{r['height']} depth {r['depth']}: "
+                f"{ratio:.2f} times baseline median"
+            )
+    return failures
+
+
+def machine():
+    """Describe the machine the benchmarks ran on."""
+    return {
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main())
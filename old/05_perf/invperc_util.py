@@ -4,6 +4,7 @@ import json
 import random
 import sys
 
+from grid_heap import GridHeap, GridHeapFloat
 from grid_lazy import GridLazy
 from grid_list import GridList
 from grid_array import GridArray
@@ -24,6 +25,8 @@ def initialize_grid(params):
         "lazy": GridLazy,
         "list": GridList,
         "array": GridArray,
+        "heap": GridHeap,
+        "heap_float": GridHeapFloat,
     }
     assert params.kind in lookup, f"Unknown grid type {params.kind}"
     cls = lookup[params.kind]
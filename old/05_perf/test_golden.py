@@ -0,0 +1,41 @@
+import random
+from pathlib import Path
+
+import pytest
+from golden import GOLDEN, load_golden, run
+from grid_array import GridArray
+from grid_list import GridList
+
+GOLDEN_RUNS = load_golden(Path(__file__).parent / GOLDEN)
+
+
+@pytest.mark.parametrize(
+    "entry",
+    GOLDEN_RUNS,
+    ids=lambda e: f"{e['kind']}-{e['size']}-{e['depth']}-{e['seed']}",
+)
+def test_matches_golden_digest(entry):
+    key = (entry["kind"], entry["size"], entry["depth"], entry["seed"])
+    assert run(*key) == entry["digest"]
+
+
+def test_list_and_array_agree():
+    digests = {
+        (e["kind"], e["size"], e["depth"], e["seed"]): e["digest"] for e in GOLDEN_RUNS
+    }
+    for (kind, *rest), digest in digests.items():
+        if kind == "list":
+            assert digests[("array", *rest)] == digest
+
+
+def test_equality_across_representations():
+    random.seed(123)
+    left = GridList(12, 9, 5)
+    random.seed(123)
+    right = GridArray(12, 9, 5)
+    assert left == right
+    assert left.digest() == right.digest()
+    right[3, 4] = 0
+    assert left != right
+    assert left.digest() != right.digest()
+    assert left != GridList(9, 12, 5)
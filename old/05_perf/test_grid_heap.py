@@ -0,0 +1,65 @@
+import random
+
+import pytest
+from grid_heap import GridHeap, GridHeapFloat
+
+
+def checked(cls):
+    """Make a subclass that checks each choice against the whole frontier."""
+
+    class Checked(cls):
+        def choose_cell(self):
+            frontier = {
+                (nx, ny)
+                for x in range(self.width())
+                for y in range(self.height())
+                if self[x, y] == 0
+                for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
+                if (0 <= nx < self.width())
+                and (0 <= ny < self.height())
+                and (self[nx, ny] != 0)
+            }
+            lowest = min(self[cell] for cell in frontier)
+            x, y = super().choose_cell()
+            assert (x, y) in frontier
+            assert self[x, y] == lowest
+            return x, y
+
+    return Checked
+
+
+@pytest.mark.parametrize("cls", [GridHeap, GridHeapFloat])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+@pytest.mark.parametrize("depth", [2, 10])
+def test_heap_fill_takes_lowest_cell_and_reaches_border(cls, seed, depth):
+    random.seed(seed)
+    grid = checked(cls)(15, 11, depth)
+    num_filled = grid.fill()
+
+    filled = {
+        (x, y)
+        for x in range(grid.width())
+        for y in range(grid.height())
+        if grid[x, y] == 0
+    }
+    assert len(filled) == num_filled
+    assert any(grid.on_border(x, y) for x, y in filled)
+    start = (grid.width() // 2, grid.height() // 2)
+    seen, todo = {start}, [start]
+    while todo:
+        x, y = todo.pop()
+        for cell in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if (cell in filled) and (cell not in seen):
+                seen.add(cell)
+                todo.append(cell)
+    assert seen == filled
+
+
+def test_float_values_in_range_without_integer_draws():
+    rng = random.Random(5)
+    grid = GridHeapFloat(4, 3, 7, rng)
+    expected = random.Random(5)
+    assert [grid[x, y] for x in range(4) for y in range(3)] == [
+        7 * (1.0 - expected.random()) for _ in range(12)
+    ]
+    assert all(0 < grid[x, y] <= 7 for x in range(4) for y in range(3))
@@ -0,0 +1,78 @@
+import invperc_bench
+from invperc_bench import compare, measure, summarize
+from params_single import ParamsSingle
+
+
+def result(median_ns, kind="lazy", size=35, depth=2):
+    return {
+        "kind": kind,
+        "width": size,
+        "height": size,
+        "depth": depth,
+        "median_ns": median_ns,
+    }
+
+
+def test_summarize_median_and_iqr():
+    summary = summarize([5, 1, 3, 2, 4])
+    assert summary["median_ns"] == 3
+    assert summary["iqr_ns"] == 2
+    assert (summary["min_ns"], summary["max_ns"]) == (1, 5)
+
+
+def test_summarize_single_run():
+    assert summarize([7])["iqr_ns"] == 0
+
+
+def test_compare_flags_only_slowdowns_beyond_threshold():
+    baseline = [result(100), result(100, depth=10)]
+    current = [result(120), result(130, depth=10), result(999, kind="list")]
+    failures = compare(current, baseline, 0.25)
+    assert len(failures) == 1
+    assert "depth 10" in failures[0]
+
+
+def test_measure_same_grids_every_time():
+    runs = [ParamsSingle("lazy", 15, 15, 5) for _ in range(3)]
+    first = measure(1234, runs, warmup=1)
+    second = measure(1234, runs, warmup=1)
+    assert first["runs"] == 3
+    assert first["num_filled"] == second["num_filled"]
+    assert first["peak_bytes"] > 0
+
+
+def test_measure_same_grids_for_every_kind(monkeypatch):
+    def initial_digests(kind):
+        digests = []
+
+        def _initialize(params):
+            grid = original(params)
+            digests.append(grid.digest())
+            return grid
+
+        monkeypatch.setattr(invperc_bench, "initialize_grid", _initialize)
+        runs = [ParamsSingle(kind, 15, 15, 5) for _ in range(3)]
+        measure(1234, runs, warmup=2, repeats=1)
+        return digests[2:5]
+
+    original = invperc_bench.initialize_grid
+    assert initial_digests("list") == initial_digests("lazy")
+
+
+def test_measure_repeats_refill_same_grid(monkeypatch):
+    digests = []
+    original = invperc_bench.initialize_grid
+
+    def _initialize(params):
+        grid = original(params)
+        digests.append(grid.digest())
+        return grid
+
+    monkeypatch.setattr(invperc_bench, "initialize_grid", _initialize)
+    runs = [ParamsSingle("lazy", 15, 15, 5) for _ in range(2)]
+    summary = measure(1234, runs, warmup=0, repeats=3)
+    assert summary["repeats"] == 3
+    timed = digests[:6]
+    assert timed[0] == timed[1] == timed[2]
+    assert timed[3] == timed[4] == timed[5]
+    assert timed[0] != timed[3]
@@ -0,0 +1,39 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from grid_array import GridArray
+from grid_heap import GridHeap, GridHeapFloat
+from grid_lazy import GridLazy
+from grid_list import GridList
+
+KINDS = [GridList, GridArray, GridLazy, GridHeap, GridHeapFloat]
+
+
+def run(cls, seed, rng=None):
+    if rng is None:
+        random.seed(seed)
+        grid = cls(19, 19, 5)
+    else:
+        grid = cls(19, 19, 5, rng=rng)
+    grid.fill()
+    return grid.digest()
+
+
+@pytest.mark.parametrize("cls", KINDS)
+def test_injected_rng_matches_global_random(cls):
+    expected = run(cls, 4321)
+    random.seed(999)
+    assert run(cls, None, random.Random(4321)) == expected
+    assert random.random() == random.Random(999).random()
+
+
+@pytest.mark.parametrize("cls", KINDS)
+def test_concurrent_grids_independent(cls):
+    seeds = [11, 22, 33, 44]
+    expected = [run(cls, seed, random.Random(seed)) for seed in seeds]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        actual = list(
+            executor.map(lambda seed: run(cls, seed, random.Random(seed)), seeds)
+        )
+    assert actual == expected
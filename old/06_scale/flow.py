@@ -4,7 +4,6 @@ from collections import defaultdict
 import csv
 import json
 from pathlib import Path
-import random
 import sys
 
 from metaflow import FlowSpec, Parameter, step
@@ -93,7 +92,6 @@ def load_params(filename):
 # [make_sweeps]
 def make_sweeps(sweeps):
     """Convert sweep parameters into individual jobs."""
-    random.seed(sweeps.seed)
     result = []
     for size in sweeps.size:
         for depth in sweeps.depth:
@@ -103,7 +101,7 @@ def make_sweeps(sweeps):
                         width=size,
                         height=size,
                         depth=depth,
-                        seed=random.randrange(sys.maxsize),
+                        seed=sweeps.job_seed(size, depth, run),
                     )
                 )
     return result
@@ -8,22 +8,31 @@ from grid_list import GridList
 class GridLazy(GridList):
     """Only look at cells that might actually be filled next time."""
 
-    def __init__(self, width, height, depth):
+    def __init__(self, width, height, depth, rng=random):
         """Construct and fill."""
-        super().__init__(width, height, depth)
+        super().__init__(width, height, depth, rng)
         self._candidates = {}
 
-    def fill(self):
-        """Fill grid one cell at a time."""
+    def fill(self, observer=None):
+        """Fill grid one cell at a time.
+
+        If an observer is given (see `observe.py`), its `observe` method
+        is called with the coordinates of each cell as it is filled, and
+        filling stops early if that returns a true value.
+        """
         x, y = self.width() // 2, self.height() // 2
         self[x, y] = 0
         num_filled = 1
+        if (observer is not None) and observer.observe(x, y):
+            return num_filled
         self.add_candidates(x, y)
 
         while True:
             x, y = self.choose_cell()
             self[x, y] = 0
             num_filled += 1
+            if (observer is not None) and observer.observe(x, y):
+                break
             if self.on_border(x, y):
                 break
         return num_filled
@@ -32,7 +41,7 @@ class GridLazy(GridList):
         """Choose the next cell to fill."""
         min_key = min(self._candidates.keys())
         available = list(sorted(self._candidates[min_key]))
-        i = random.randrange(len(available))
+        i = self._rng.randrange(len(available))
         choice = available[i]
         del available[i]
         if not available:
@@ -5,16 +5,22 @@ from grid_generic import GridGeneric
 
 
 class GridList(GridGeneric):
-    """Represent grid as list of lists."""
+    """Represent grid as list of lists.
 
-    def __init__(self, width, height, depth):
+    Random numbers come from `rng`, which may be the `random` module
+    itself (the default) or a `random.Random` object, so that grids
+    filled at the same time do not share one generator.
+    """
+
+    def __init__(self, width, height, depth, rng=random):
         """Construct and fill."""
         super().__init__(width, height, depth)
+        self._rng = rng
         self._grid = []
         for x in range(self._width):
             row = []
             for y in range(self._height):
-                row.append(random.randint(1, depth))
+                row.append(rng.randint(1, depth))
             self._grid.append(row)
 
     def __getitem__(self, key):
@@ -8,11 +8,16 @@ from grid_lazy import GridLazy
 from params_single import ParamsSingle
 
 
-def invperc(params):
-    """Invasion percolation."""
-    random.seed(params.seed)
-    grid = GridLazy(params.width, params.height, params.depth)
-    grid.fill()
+def invperc(params, observer=None):
+    """Invasion percolation, optionally observing each filled cell.
+
+    Uses a generator of its own seeded from `params.seed`, so the
+    global state of `random` is left alone and runs in different
+    threads do not interfere.
+    """
+    rng = random.Random(params.seed)
+    grid = GridLazy(params.width, params.height, params.depth, rng)
+    grid.fill(observer)
     return grid
 
 
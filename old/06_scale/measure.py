@@ -1,31 +1,54 @@
 """Measure density and fractal dimension of grids."""
 
-from collections import defaultdict
-from math import sqrt
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
 
 
-def collect_density(grid):
-    """Calculate density versus distance from center of grid."""
+def collect_density(grid, width=None):
+    """Calculate density versus distance from center of grid.
+
+    By default there is one point for each distinct distance from the
+    center. If `width` is given, cells are instead grouped into annuli
+    of that width, and each point is at the mean distance of the cells
+    in its annulus.
+    """
     assert grid.width() == grid.height()
     size = grid.width()
 
-    cx, cy = size // 2, size // 2
-    count_cells = defaultdict(int)
-    count_filled = defaultdict(int)
-    for x in range(size):
-        for y in range(size):
-            dist_2 = (x - cx) ** 2 + (y - cy) ** 2
-            count_cells[dist_2] += 1
-            if grid[x, y] == 0:
-                count_filled[dist_2] += 1
+    distances, index, count_cells = distance_bins(size, width)
+    filled = np.array(grid.values()).reshape(-1) == 0
+    count_filled = np.bincount(index, weights=filled, minlength=len(count_cells))
+    return list(zip(distances.tolist(), (count_filled / count_cells).tolist()))
+
 
-    return [
-        (sqrt(dist_2), count_filled[dist_2] / count_cells[dist_2])
-        for dist_2 in sorted(count_cells.keys())
-    ]
+@lru_cache(maxsize=16)
+def distance_bins(size, width=None):
+    """Group the cells of a grid by distance from its center.
+
+    Returns the distance of each group, the group of each cell (in the
+    same order as a flattened grid), and the number of cells in each
+    group. Groups are distinct distances if `width` is `None`, or annuli
+    of the given width otherwise. Results are cached by size and width
+    and must not be modified.
+    """
+    center = size // 2
+    offsets = np.arange(size) - center
+    dist_2 = (offsets[:, None] ** 2 + offsets[None, :] ** 2).reshape(-1)
+    if width is None:
+        keys, index, counts = np.unique(dist_2, return_inverse=True, return_counts=True)
+        distances = np.sqrt(keys)
+    else:
+        assert width > 0, f"Annulus width must be positive not {width}"
+        dist = np.sqrt(dist_2)
+        _, index, counts = np.unique(
+            (dist // width).astype(np.int64), return_inverse=True, return_counts=True
+        )
+        distances = np.bincount(index, weights=dist) / counts
+    for array in (distances, index, counts):
+        array.flags.writeable = False
+    return distances, index, counts
 
 
 def estimate_density(densities):
@@ -37,24 +60,37 @@ def estimate_density(densities):
 def measure_dimension(grid):
     """Estimate fractal dimension of grid."""
     assert grid.width() == grid.height()
-    size = grid.width()
     grid = np.logical_not(np.array(grid.values(), dtype=bool))
+    return fit_dimension(count_boxes(grid))
 
-    boxes = []
-    ruler = 1
-    while ruler < size:
-        count = 0
-        for x in range(size // ruler):
-            for y in range(size // ruler):
-                count = (
-                    count
-                    + grid[
-                        (x * ruler) : ((x + 1) * ruler), (y * ruler) : ((y + 1) * ruler)
-                    ].any()
-                )
-        boxes.append((ruler, count))
-        ruler *= 2
 
+def fit_dimension(boxes):
+    """Estimate fractal dimension from (ruler, count) pairs."""
     df = pd.DataFrame(boxes, columns=["ruler", "count"])
     dim = -np.polyfit(np.log(df["ruler"]), np.log(df["count"]), 1)[0]
     return dim
+
+
+def count_boxes(filled):
+    """Count boxes containing filled cells for rulers 1, 2, 4, ... < size.
+
+    Only boxes that lie entirely inside the grid are counted. Instead of
+    checking each box separately, build a pyramid: pad the grid with
+    empty cells to a power-of-two size, then repeatedly combine each
+    2x2 block into one cell that is filled if any of the four are. Cell
+    `[x, y]` of level `k` then covers box `(x, y)` at ruler `2**k`.
+    """
+    size = filled.shape[0]
+    padded = 1 << (size - 1).bit_length()
+    level = np.zeros((padded, padded), dtype=bool)
+    level[:size, :size] = filled
+
+    boxes = []
+    ruler = 1
+    while ruler < size:
+        n = size // ruler
+        boxes.append((ruler, int(np.count_nonzero(level[:n, :n]))))
+        half = level.shape[0] // 2
+        level = level.reshape(half, 2, half, 2).any(axis=(1, 3))
+        ruler *= 2
+    return boxes
@@ -0,0 +1,114 @@
+"""Observe grids as they are filled."""
+
+import numpy as np
+
+from measure import distance_bins, fit_dimension
+
+
+class Observer:
+    """Base class for objects notified of each cell as it is filled.
+
+    `GridLazy.fill` calls `observe(x, y)` after filling each cell,
+    starting with the center; if it returns a true value, filling stops
+    early.
+    """
+
+    def observe(self, x, y):
+        """Record that (x, y) has been filled and say whether to stop."""
+        return False
+
+
+class Metrics(Observer):
+    """Update density, box counts, and radius as cells are filled.
+
+    The results are the same as running `collect_density` and
+    `measure_dimension` on the grid afterward, but each filled cell
+    only costs a few operations per ruler size instead of a full pass
+    over the grid. `until` is an optional function that is given this
+    object after each cell and returns true to stop filling (see
+    `converged`).
+    """
+
+    def __init__(self, size, width=None, until=None):
+        """Construct metrics for a square grid.
+
+        Args:
+            size: size of grid.
+            width: annulus width for density (see `collect_density`).
+            until: stopping test, or `None` to fill to the border.
+        """
+        self.size = size
+        self.num_filled = 0
+        self._until = until
+        self._center = size // 2
+        self._max_dist_2 = 0
+
+        self._distances, self._bin, self._cells = distance_bins(size, width)
+        self._filled = np.zeros(len(self._cells), dtype=np.int64)
+
+        self._rulers = []
+        ruler = 1
+        while ruler < size:
+            self._rulers.append(ruler)
+            ruler *= 2
+        self._boxes = [0] * len(self._rulers)
+        self._occupied = [bytearray((size // r) ** 2) for r in self._rulers]
+
+    def observe(self, x, y):
+        """Update metrics for a newly filled cell."""
+        size = self.size
+        self.num_filled += 1
+        self._filled[self._bin[x * size + y]] += 1
+        dist_2 = (x - self._center) ** 2 + (y - self._center) ** 2
+        self._max_dist_2 = max(self._max_dist_2, dist_2)
+
+        for level, ruler in enumerate(self._rulers):
+            n = size // ruler
+            bx, by = x // ruler, y // ruler
+            if (bx < n) and (by < n):
+                i = bx * n + by
+                if not self._occupied[level][i]:
+                    self._occupied[level][i] = 1
+                    self._boxes[level] += 1
+
+        return (self._until is not None) and self._until(self)
+
+    def density(self):
+        """Density versus distance, as returned by `collect_density`."""
+        density = self._filled / self._cells
+        return list(zip(self._distances.tolist(), density.tolist()))
+
+    def boxes(self):
+        """(ruler, count) pairs, as returned by `count_boxes`."""
+        return list(zip(self._rulers, self._boxes))
+
+    def dimension(self):
+        """Fractal dimension, as returned by `measure_dimension`."""
+        return fit_dimension(self.boxes())
+
+    def radius(self):
+        """Greatest distance of any filled cell from the center."""
+        return float(np.sqrt(self._max_dist_2))
+
+
+def converged(metric, tolerance, every=100):
+    """Make a stopping test for `Metrics` from a metric and a tolerance.
+
+    The metric (such as `Metrics.dimension`) is evaluated every `every`
+    cells, and the test is true once it changes by less than
+    `tolerance` between two evaluations.
+    """
+    previous = None
+
+    def _test(metrics):
+        nonlocal previous
+        if metrics.num_filled % every != 0:
+            return False
+        current = metric(metrics)
+        if not np.isfinite(current):
+            return False
+        result = (previous is not None) and (abs(current - previous) < tolerance)
+        previous = current
+        return result
+
+    return _test
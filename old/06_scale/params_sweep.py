@@ -1,5 +1,9 @@
 """Parameters for invasion percolation sweep."""
 
+import hashlib
+import json
+import random
+import sys
 from dataclasses import dataclass
 
 
@@ -11,3 +15,16 @@ class ParamsSweep:
     depth: list[int]
     runs: int
     seed: int = None
+
+    def job_seed(self, size, depth, run):
+        """Seed for one run of one point in the sweep.
+
+        The seed is a hash of the sweep's seed and the job's position in
+        the sweep, so it does not change when sizes, depths, or runs are
+        added. Without a sweep seed, each job gets a random seed.
+        """
+        if self.seed is None:
+            return random.randrange(sys.maxsize)
+        text = json.dumps([self.seed, size, depth, run])
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "little") % sys.maxsize
@@ -0,0 +1,147 @@
+"""Run a parameter sweep locally with a process pool and a result cache.
+
+Each job's result is stored as JSON in the cache directory under the
+SHA-256 of its parameters (including its seed), and is written as soon
+as the job finishes. Files are written to a temporary name and then
+renamed, so an interrupted sweep never leaves a partial result behind;
+re-running the same sweep only computes jobs that have no cached
+result. Each job's seed depends only on the sweep's seed and the job's
+size, depth, and run number (see `ParamsSweep.job_seed`), so adding
+sizes, depths, or runs to a sweep only computes the new points. Jobs
+are generated exactly as `make_sweeps` in `flow.py` does, so the two
+produce the same grids for the same sweep file.
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict
+from pathlib import Path
+
+from invperc import invperc
+from measure import estimate_density
+from observe import Metrics
+from params_single import ParamsSingle
+from params_sweep import ParamsSweep
+
+CACHE_DIR = "cache"
+CACHE_VERSION = 1  # change to invalidate results from older code
+
+
+def main():
+    """Main driver."""
+    args = cmdline_args()
+    sweep = ParamsSweep(**json.loads(Path(args.sweep).read_text()))
+    cache = Path(args.cache)
+    cache.mkdir(parents=True, exist_ok=True)
+    results = run_sweep(make_jobs(sweep), cache, args.workers)
+    csv.writer(sys.stdout, lineterminator="\n").writerows(summarize(results))
+
+
+def cmdline_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("sweep", help="sweep parameter file")
+    parser.add_argument("--cache", default=CACHE_DIR, help="result cache directory")
+    parser.add_argument("--workers", type=int, help="worker processes (default all)")
+    return parser.parse_args()
+
+
+def make_jobs(sweep):
+    """Convert sweep parameters into individual jobs."""
+    result = []
+    for size in sweep.size:
+        for depth in sweep.depth:
+            for run in range(sweep.runs):
+                result.append(
+                    ParamsSingle(
+                        width=size,
+                        height=size,
+                        depth=depth,
+                        seed=sweep.job_seed(size, depth, run),
+                    )
+                )
+    return result
+
+
+def job_key(params):
+    """Hash of a job's parameters."""
+    text = json.dumps({"version": CACHE_VERSION, **asdict(params)}, sort_keys=True)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def run_sweep(jobs, cache, workers=None):
+    """Run jobs that are not yet cached and return all results in job order.
+
+    Every job that succeeds is cached even if others fail; failures are
+    reported together once all jobs have finished.
+    """
+    paths = [cache / f"{job_key(params)}.json" for params in jobs]
+    pending = {path: params for path, params in zip(paths, jobs) if not path.exists()}
+    failures = []
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(run_job, params): path
+                for path, params in pending.items()
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    save_result(path, future.result())
+                except Exception as exc:  # noqa: BLE001 (report any job failure)
+                    failures.append((pending[path], exc))
+    if failures:
+        details = "\n".join(f"{params}: {exc!r}" for params, exc in failures)
+        raise RuntimeError(
+            f"{len(failures)} of {len(pending)} jobs failed:\n{details}"
+        ) from failures[0][1]
+    return [json.loads(path.read_text()) for path in paths]
+
+
+def run_job(params):
+    """Run a single job, measuring the result as the grid is filled."""
+    metrics = Metrics(params.width)
+    grid = invperc(params, metrics)
+    return {
+        "params": asdict(params),
+        "size": grid.width(),
+        "depth": grid.depth(),
+        "density": metrics.density(),
+        "dimension": metrics.dimension(),
+    }
+
+
+def save_result(path, result):
+    """Write a result atomically."""
+    temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temp.write_text(json.dumps(result))
+    os.replace(temp, path)
+
+
+def summarize(results):
+    """Combine results into a table like the one `flow.py` reports."""
+    counts = defaultdict(int)
+    dimensions = defaultdict(float)
+    densities = defaultdict(list)
+    for r in results:
+        key = (r["size"], r["depth"])
+        counts[key] += 1
+        dimensions[key] += r["dimension"]
+        densities[key].extend(r["density"])
+
+    table = [("size", "depth", "count", "dimension", "density_x", "density_k")]
+    for key, count in sorted(counts.items()):
+        size, depth = key
+        dim = dimensions[key] / count
+        table.append((size, depth, count, dim, *estimate_density(densities[key])))
+    return table
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import random
+from collections import defaultdict
+from math import sqrt
+
+import numpy as np
+import pytest
+from grid_list import GridList
+from invperc import invperc
+from measure import collect_density, count_boxes, distance_bins, measure_dimension
+from params_single import ParamsSingle
+
+
+def reference_boxes(filled):
+    size = filled.shape[0]
+    boxes = []
+    ruler = 1
+    while ruler < size:
+        count = 0
+        for x in range(size // ruler):
+            for y in range(size // ruler):
+                box = filled[x * ruler : (x + 1) * ruler, y * ruler : (y + 1) * ruler]
+                count += box.any()
+        boxes.append((ruler, count))
+        ruler *= 2
+    return boxes
+
+
+@pytest.mark.parametrize("size", [2, 3, 7, 8, 15, 16, 33, 100])
+@pytest.mark.parametrize("fraction", [0.01, 0.2, 0.7])
+def test_count_boxes_matches_reference(size, fraction):
+    rng = np.random.default_rng(size)
+    filled = rng.random((size, size)) < fraction
+    assert count_boxes(filled) == reference_boxes(filled)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_dimension_of_filled_grid(seed):
+    grid = invperc(ParamsSingle(35, 35, 10, seed))
+    filled = np.logical_not(np.array(grid.values(), dtype=bool))
+    assert count_boxes(filled) == reference_boxes(filled)
+    assert 0 < measure_dimension(grid) < 2
+
+
+def test_dimension_of_full_grid_is_two():
+    random.seed(1)
+    grid = GridList(32, 32, 5)
+    for x in range(32):
+        for y in range(32):
+            grid[x, y] = 0
+    assert measure_dimension(grid) == pytest.approx(2)
+
+
+def reference_density(grid):
+    size = grid.width()
+    cx, cy = size // 2, size // 2
+    count_cells = defaultdict(int)
+    count_filled = defaultdict(int)
+    for x in range(size):
+        for y in range(size):
+            dist_2 = (x - cx) ** 2 + (y - cy) ** 2
+            count_cells[dist_2] += 1
+            if grid[x, y] == 0:
+                count_filled[dist_2] += 1
+    return [
+        (sqrt(dist_2), count_filled[dist_2] / count_cells[dist_2])
+        for dist_2 in sorted(count_cells.keys())
+    ]
+
+
+@pytest.mark.parametrize("size", [3, 4, 15, 35, 36])
+@pytest.mark.parametrize("seed", [1, 2])
+def test_density_matches_reference(size, seed):
+    grid = invperc(ParamsSingle(size, size, 10, seed))
+    assert collect_density(grid) == reference_density(grid)
+
+
+@pytest.mark.parametrize("width", [0.5, 1, 2.5, 10])
+def test_density_by_annulus(width):
+    grid = invperc(ParamsSingle(35, 35, 10, 7))
+    _, index, counts = distance_bins(35, width)
+    assert counts.sum() == 35 * 35
+    assert len(np.unique(index)) == len(counts)
+    density = collect_density(grid, width)
+    assert len(density) == len(counts)
+    assert [d for d, _ in density] == sorted(d for d, _ in density)
+    filled = sum(f * c for (_, f), c in zip(density, counts))
+    assert filled == pytest.approx(sum(row.count(0) for row in grid.values()))
+
+
+def test_distance_bins_cached_and_read_only():
+    assert distance_bins(21) is distance_bins(21)
+    with pytest.raises(ValueError):
+        distance_bins(21)[1][0] = 0
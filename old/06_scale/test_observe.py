@@ -0,0 +1,54 @@
+from math import sqrt
+
+import numpy as np
+import pytest
+from invperc import invperc
+from measure import collect_density, count_boxes, measure_dimension
+from observe import Metrics, Observer, converged
+from params_single import ParamsSingle
+
+
+def filled_mask(grid):
+    return np.array(grid.values()) == 0
+
+
+@pytest.mark.parametrize("size", [15, 35, 36])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_metrics_match_post_pass(size, seed):
+    params = ParamsSingle(size, size, 10, seed)
+    metrics = Metrics(size)
+    grid = invperc(params, metrics)
+    assert metrics.num_filled == filled_mask(grid).sum()
+    assert metrics.density() == collect_density(grid)
+    assert metrics.boxes() == count_boxes(filled_mask(grid))
+    assert metrics.dimension() == measure_dimension(grid)
+    cells = np.argwhere(filled_mask(grid)) - size // 2
+    assert metrics.radius() == sqrt((cells**2).sum(axis=1).max())
+
+
+def test_annulus_density_matches_post_pass():
+    metrics = Metrics(35, width=2.5)
+    grid = invperc(ParamsSingle(35, 35, 10, 4), metrics)
+    assert metrics.density() == collect_density(grid, 2.5)
+
+
+def test_base_observer_does_not_change_fill():
+    params = ParamsSingle(25, 25, 10, 5)
+    assert invperc(params, Observer()) == invperc(params)
+
+
+def test_stop_early():
+    metrics = Metrics(55, until=lambda m: m.num_filled == 20)
+    grid = invperc(ParamsSingle(55, 55, 10, 6), metrics)
+    assert filled_mask(grid).sum() == 20
+
+
+def test_converged_stops_when_metric_settles():
+    values = iter([1.0, 0.5, 0.45, 0.44])
+    test = converged(lambda m: next(values), tolerance=0.02, every=10)
+    metrics = Metrics(15)
+    results = []
+    for n in range(1, 41):
+        metrics.num_filled = n
+        results.append(test(metrics))
+    assert [n + 1 for n, r in enumerate(results) if r] == [40]
@@ -0,0 +1,24 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from grid_lazy import GridLazy
+from invperc import invperc
+from params_single import ParamsSingle
+
+
+def test_invperc_matches_global_seed_and_leaves_global_alone():
+    params = ParamsSingle(21, 21, 5, 2468)
+    random.seed(params.seed)
+    expected = GridLazy(21, 21, 5)
+    expected.fill()
+    random.seed(1)
+    assert invperc(params) == expected
+    assert random.random() == random.Random(1).random()
+
+
+def test_concurrent_runs_independent():
+    params = [ParamsSingle(25, 25, 10, seed) for seed in range(6)]
+    expected = [invperc(p).values() for p in params]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        actual = [grid.values() for grid in executor.map(invperc, params)]
+    assert actual == expected
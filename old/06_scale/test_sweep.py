@@ -0,0 +1,89 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import sweep
+from params_sweep import ParamsSweep
+
+SWEEP = ParamsSweep(size=[11, 15], depth=[3], runs=2, seed=12345)
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Run jobs in threads and record which ones actually ran."""
+    ran = []
+    original = sweep.run_job
+
+    def run_job(params):
+        ran.append(params)
+        return original(params)
+
+    monkeypatch.setattr(sweep, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(sweep, "run_job", run_job)
+    return ran
+
+
+def test_jobs_reproducible_and_keys_distinct():
+    first, second = sweep.make_jobs(SWEEP), sweep.make_jobs(SWEEP)
+    assert first == second
+    assert len({sweep.job_key(p) for p in first}) == len(first)
+
+
+def test_extending_sweep_keeps_existing_jobs(tmp_path, calls):
+    jobs = sweep.make_jobs(SWEEP)
+    sweep.run_sweep(jobs, tmp_path)
+    bigger = ParamsSweep(size=[11, 15, 21], depth=[2, 3], runs=3, seed=SWEEP.seed)
+    extended = sweep.make_jobs(bigger)
+    assert set(map(sweep.job_key, jobs)) < set(map(sweep.job_key, extended))
+
+    calls.clear()
+    sweep.run_sweep(extended, tmp_path)
+    assert len(calls) == len(extended) - len(jobs)
+
+
+def test_cached_results_reused(tmp_path, calls):
+    jobs = sweep.make_jobs(SWEEP)
+    first = sweep.run_sweep(jobs, tmp_path)
+    assert len(calls) == len(jobs)
+    assert len(list(tmp_path.glob("*.json"))) == len(jobs)
+    assert not list(tmp_path.glob("*.tmp"))
+
+    calls.clear()
+    assert sweep.run_sweep(jobs, tmp_path) == first
+    assert calls == []
+
+
+def test_resume_runs_only_missing_jobs(tmp_path, calls):
+    jobs = sweep.make_jobs(SWEEP)
+    first = sweep.run_sweep(jobs, tmp_path)
+    (tmp_path / f"{sweep.job_key(jobs[1])}.json").unlink()
+    (tmp_path / "partial.json.123.tmp").write_text("{")
+
+    calls.clear()
+    assert sweep.run_sweep(jobs, tmp_path) == first
+    assert calls == [jobs[1]]
+
+
+def test_failed_job_does_not_lose_other_results(tmp_path, calls, monkeypatch):
+    jobs = sweep.make_jobs(SWEEP)
+    succeed = sweep.run_job
+
+    def run_job(params):
+        if params == jobs[2]:
+            raise ValueError("broken job")
+        return succeed(params)
+
+    monkeypatch.setattr(sweep, "run_job", run_job)
+    with pytest.raises(RuntimeError, match="1 of 4 jobs failed"):
+        sweep.run_sweep(jobs, tmp_path)
+    assert len(list(tmp_path.glob("*.json"))) == len(jobs) - 1
+
+    calls.clear()
+    monkeypatch.setattr(sweep, "run_job", succeed)
+    assert len(sweep.run_sweep(jobs, tmp_path)) == len(jobs)
+    assert calls == [jobs[2]]
+
+
+def test_summarize_groups_by_size_and_depth(tmp_path, calls):
+    table = sweep.summarize(sweep.run_sweep(sweep.make_jobs(SWEEP), tmp_path))
+    assert table[0][:3] == ("size", "depth", "count")
+    assert [row[:3] for row in table[1:]] == [(11, 3, 2), (15, 3, 2)]
@@ -1,5 +1,5 @@
 """Package file for invasion percolation."""
 
-from .invperc import invperc  # noqa: F401
+from .invperc import invperc, invperc_lattice  # noqa: F401
 
 __version__ = "0.2.0"
@@ -3,7 +3,11 @@
 import argparse
 import random
 
-from . import invperc
+from .frontier import FRONTIERS
+from .invperc import GRIDS
+from .lattice import Lattice
+from .profiling import PHASES, Profiler
+from .values import INITIALIZERS
 
 DEPTH = 10  # default range of random values in grid
 HEIGHT = 15  # default Y dimension of grid
@@ -14,14 +18,52 @@ def main():
     """Main command-line driver for invasion percolation."""
     parser = argparse.ArgumentParser()
     parser.add_argument("--depth", type=int, default=DEPTH, help="random depth")
+    parser.add_argument(
+        "--frontier", choices=FRONTIERS, default="sorted", help="candidate storage"
+    )
+    parser.add_argument(
+        "--grid", choices=GRIDS, default="list", help="grid representation"
+    )
     parser.add_argument("--height", type=int, default=HEIGHT, help="grid height")
+    parser.add_argument(
+        "--init", choices=INITIALIZERS, default="legacy", help="value generator"
+    )
+    parser.add_argument("--layers", type=int, help="Z size for a 3-D lattice")
+    parser.add_argument("--profile", type=str, help="prefix for profiling output")
+    parser.add_argument(
+        "--profile-phases",
+        nargs="+",
+        choices=PHASES,
+        default=PHASES,
+        help="phases to profile (all are timed)",
+    )
     parser.add_argument("--seed", type=int, required=True, help="RNG seed")
+    parser.add_argument("--trapping", action="store_true", help="fill with trapping")
     parser.add_argument("--width", type=int, default=WIDTH, help="grid width")
     args = parser.parse_args()
+    if args.trapping and (args.layers is not None):
+        parser.error("--trapping cannot be used with --layers")
+    if (args.grid != "list") and (args.layers is not None):
+        parser.error(f"--grid {args.grid} cannot be used with --layers")
 
-    random.seed(args.seed)
-    grid = invperc(args.width, args.height, args.depth)
-    print(grid)
+    profiler = Profiler(args.profile, args.profile_phases)
+    rng = random.Random(args.seed)
+    with profiler.phase("init"):
+        if args.layers is None:
+            grid = GRIDS[args.grid](
+                args.width, args.height, args.depth, args.frontier, args.init, rng
+            )
+        else:
+            shape = (args.layers, args.width, args.height)
+            grid = Lattice(shape, args.depth, args.frontier, args.init, rng)
+    with profiler.phase("fill"):
+        if args.layers is None:
+            grid.fill(args.trapping)
+        else:
+            grid.fill()
+    with profiler.phase("output"):
+        print(grid)
+    profiler.save()
 
     return 0
 
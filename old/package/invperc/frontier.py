@@ -0,0 +1,124 @@
+"""Frontiers of candidate cells for invasion percolation.
+
+A frontier holds the unfilled cells next to the filled region in
+buckets keyed by cell value, and keeps the values of non-empty buckets
+in a heap so that finding the next cell to fill does not require
+scanning every value. Memory and time therefore depend on the number
+of candidates and distinct values seen, not on the grid's depth.
+"""
+
+import heapq
+import random
+from bisect import bisect_left
+
+
+class SortedBuckets:
+    """Frontier whose buckets are kept in sorted order.
+
+    Popping picks a random index into the sorted cells with the lowest
+    value, which is exactly what the original `set`-based implementation
+    did, so grids are identical seed for seed. Insertion and removal
+    cost O(k) memory moves for a bucket of size k instead of the
+    original O(k log k) sort on every step.
+    """
+
+    def __init__(self, depth, rng=random):
+        """Construct empty frontier for values in 1..depth.
+
+        Args:
+            depth: largest cell value (positive integer).
+            rng: source of random numbers: the `random` module (the
+                default) or a `random.Random` object.
+        """
+        self._rng = rng
+        self._buckets = {}
+        self._values = []
+
+    def __len__(self):
+        """Number of candidate cells."""
+        return sum(len(b) for b in self._buckets.values())
+
+    def add(self, value, cell):
+        """Add a cell if it is not already a candidate.
+
+        Args:
+            value: value of cell (integer in 1..depth).
+            cell: cell coordinates.
+        """
+        bucket = self._bucket(value)
+        i = bisect_left(bucket, cell)
+        if (i == len(bucket)) or (bucket[i] != cell):
+            bucket.insert(i, cell)
+
+    def pop(self):
+        """Remove and return a random cell with the lowest value."""
+        bucket = self._buckets[self._values[0]]
+        cell = bucket.pop(self._rng.randrange(len(bucket)))
+        self._discard_if_empty(bucket)
+        return cell
+
+    def _bucket(self, value):
+        """Get the bucket for a value, creating it if necessary."""
+        bucket = self._buckets.get(value)
+        if bucket is None:
+            bucket = self._buckets[value] = []
+            heapq.heappush(self._values, value)
+        return bucket
+
+    def _discard_if_empty(self, bucket):
+        """Remove the lowest-value bucket once it has been emptied."""
+        if not bucket:
+            del self._buckets[heapq.heappop(self._values)]
+
+
+class RandomBuckets(SortedBuckets):
+    """Frontier whose buckets are unordered.
+
+    Adding and popping a cell are O(1) apart from the heap of values:
+    a popped cell is swapped with the last cell in its bucket before
+    removal. Grids are filled with the same statistics as
+    `SortedBuckets` but are not identical to the original
+    implementation for the same seed.
+    """
+
+    def __init__(self, depth, rng=random):
+        """Construct empty frontier for values in 1..depth.
+
+        Args:
+            depth: largest cell value (positive integer).
+            rng: source of random numbers (see `SortedBuckets`).
+        """
+        super().__init__(depth, rng)
+        self._members = set()
+
+    def __len__(self):
+        """Number of candidate cells."""
+        return len(self._members)
+
+    def add(self, value, cell):
+        """Add a cell if it is not already a candidate.
+
+        Args:
+            value: value of cell (integer in 1..depth).
+            cell: cell coordinates.
+        """
+        if cell in self._members:
+            return
+        self._members.add(cell)
+        self._bucket(value).append(cell)
+
+    def pop(self):
+        """Remove and return a random cell with the lowest value."""
+        bucket = self._buckets[self._values[0]]
+        i = self._rng.randrange(len(bucket))
+        bucket[i], bucket[-1] = bucket[-1], bucket[i]
+        cell = bucket.pop()
+        self._members.discard(cell)
+        self._discard_if_empty(bucket)
+        return cell
+
+
+FRONTIERS = {
+    "sorted": SortedBuckets,
+    "bucket": RandomBuckets,
+}
@@ -1,6 +1,13 @@
 """Two-dimensional grid that can simulate invasion percolation."""
 
+import hashlib
 import random
+from array import array
+
+import numpy as np
+
+from .frontier import FRONTIERS
+from .values import INITIALIZERS
 
 
 class Grid:
@@ -8,22 +15,42 @@ class Grid:
 
     This class uses a list-of-lists representation of a rectangular
     grid, and keeps track of candidate cells on the border of the
-    already-filled region to make filling faster.
+    already-filled region in a bucket queue (see `frontier.py`) to
+    make filling faster.
+
+    Filling records the order in which cells were filled as an array
+    of 32-bit flat indices `x * height + y` (4 bytes per filled cell),
+    so that the state of the grid after any number of steps can be
+    reconstructed from a single run.
     """
 
-    def __init__(self, width, height, depth):
+    def __init__(
+        self, width, height, depth, frontier="sorted", init="legacy", rng=random
+    ):
         """Construct grid.
 
         Args:
             width: X size of grid (positive integer).
             height: Y size of grid (positive integer).
             depth: range of random grid values (positive integer).
+            frontier: "sorted" (default) to reproduce the original
+                results seed for seed, or "bucket" for O(1) choice
+                of the next cell.
+            init: "legacy" (default) to draw the same values as the
+                original cell-by-cell loop, or "numpy" for a faster
+                generator (see `values.py`).
+            rng: source of random numbers: the `random` module (the
+                default) or a `random.Random` object.
         """
+        assert frontier in FRONTIERS, f"Unknown frontier {frontier}"
+        assert init in INITIALIZERS, f"Unknown initializer {init}"
+        assert width * height <= 2**32, "Grid too large for 32-bit fill order"
         self._width = width
         self._height = height
         self._depth = depth
-        self._init_grid()
-        self._candidates = {}
+        self._init_grid(INITIALIZERS[init], rng)
+        self._candidates = FRONTIERS[frontier](depth, rng)
+        self._fill_order = array("I")
 
     def __getitem__(self, key):
         """Get value at location.
@@ -55,17 +82,13 @@ class Grid:
 
         Returns:
             `True` if grids are the same size and contain equal
-            values, `False` otherwise.
+            values (with 0 for filled cells), `False` otherwise.
         """
         if self.width != other.width:
             return False
         if self.height != other.height:
             return False
-        for x in range(self.width):
-            for y in range(self.height):
-                if self[x, y] != other[x, y]:
-                    return False
-        return True
+        return np.array_equal(self.to_array(), other.to_array())
 
     def __str__(self):
         """Create string representation of grid.
@@ -75,7 +98,7 @@ class Grid:
         """
         rows = []
         for y in range(self.height - 1, -1, -1):
-            row = ("X" if self[x, y] == 0 else "." for x in range(self.width))
+            row = ("X" if self._is_filled(x, y) else "." for x in range(self.width))
             rows.append("".join(row))
         return "\n".join(rows)
 
@@ -94,20 +117,91 @@ class Grid:
         """Depth of grid."""
         return self._depth
 
-    def fill(self):
-        """Fill grid one cell at a time from the center."""
-        x, y = self.width // 2, self.height // 2
-        self[x, y] = 0
-        num_filled = 1
+    @property
+    def fill_order(self):
+        """Flat indices `x * height + y` of filled cells in fill order."""
+        return self._fill_order
+
+    def filled_at(self, step):
+        """Reconstruct which cells were filled after a number of steps.
+
+        Takes O(step) time after allocating the result.
+
+        Args:
+            step: number of cells filled so far (0 to `len(fill_order)`).
+
+        Returns:
+            Boolean NumPy array indexed by `[x, y]`.
+        """
+        order = self._fill_order
+        assert 0 <= step <= len(order), f"Step {step} out of range"
+        filled = np.zeros(self.width * self.height, dtype=bool)
+        filled[np.frombuffer(order, dtype=np.uint32, count=step)] = True
+        return filled.reshape(self.width, self.height)
+
+    def to_array(self):
+        """Get contents as a NumPy array.
+
+        Returns:
+            Integer array indexed by `[x, y]` with 0 for filled cells.
+        """
+        return np.array(self._grid, dtype=np.int64)
+
+    def digest(self):
+        """Hash the size and contents of the grid.
+
+        Values (with 0 for filled cells) are hashed as a contiguous
+        buffer of little-endian 64-bit integers, so grids that compare
+        equal have the same digest whatever class and platform produced
+        them.
+
+        Returns:
+            Hexadecimal SHA-256 digest.
+        """
+        values = np.ascontiguousarray(self.to_array(), dtype="<i8")
+        result = hashlib.sha256(f"{self.width}x{self.height}:".encode())
+        result.update(values.tobytes())
+        return result.hexdigest()
+
+    def fill(self, trapping=False):
+        """Fill grid one cell at a time from the center.
+
+        With trapping, a region of unfilled cells that the filled region
+        cuts off from the border of the grid can no longer be filled.
+        Trapping does not change which untrapped cells are filled or in
+        what order, so this does an ordinary fill while recording the
+        cells it chooses, then un-fills the ones that were trapped when
+        they were chosen (see `_untrap`) and removes them from the
+        fill order.
+
+        Args:
+            trapping: whether to fill with trapping.
+
+        Returns:
+            Number of cells filled.
+        """
+        height = self.height
+        order = self._fill_order
+        x, y = self.width // 2, height // 2
+        self._mark_filled(x, y)
+        order.append(x * height + y)
         self._add_candidates(x, y)
 
+        chosen = []
         while True:
             x, y = self._choose_cell()
-            self[x, y] = 0
-            num_filled += 1
+            if trapping:
+                chosen.append((x, y, self[x, y]))
+            self._mark_filled(x, y)
+            order.append(x * height + y)
             if self._on_border(x, y):
                 break
-        return num_filled
+
+        if trapping:
+            trapped = self._untrap(chosen)
+            if trapped:
+                self._fill_order = array("I", (i for i in order if i not in trapped))
+        return len(self._fill_order)
 
     def _add_candidates(self, x, y):
         """Add candidates around specified coordinate.
@@ -130,12 +224,9 @@ class Grid:
         """
         if (x < 0) or (x >= self.width) or (y < 0) or (y >= self.height):
             return
-        if self[x, y] == 0:
+        if self._is_filled(x, y):
             return
-        value = self[x, y]
-        if value not in self._candidates:
-            self._candidates[value] = set()
-        self._candidates[value].add((x, y))
+        self._candidates.add(self[x, y], (x, y))
 
     def _choose_cell(self):
         """Choose the next cell to fill.
@@ -145,26 +236,46 @@ class Grid:
         candidates for filling; one of these cells is chosen at
         random.
         """
-        min_key = min(self._candidates.keys())
-        available = list(sorted(self._candidates[min_key]))
-        i = random.randrange(len(available))
-        choice = available[i]
-        del available[i]
-        if not available:
-            del self._candidates[min_key]
-        else:
-            self._candidates[min_key] = set(available)
+        choice = self._candidates.pop()
         self._add_candidates(*choice)
         return choice
 
-    def _init_grid(self):
-        """Create and fill list-of-lists grid."""
-        self._grid = []
-        for x in range(self.width):
-            row = []
-            for y in range(self.height):
-                row.append(random.randint(1, self.depth))
-            self._grid.append(row)
+    def _clear_filled(self, x, y, value):
+        """Mark a cell as unfilled by restoring its value.
+
+        Args:
+            x: X-axis coordinate of cell to clear.
+            y: Y-axis coordinate of cell to clear.
+            value: original value of cell.
+        """
+        self._grid[x][y] = value
+
+    def _init_grid(self, initializer, rng):
+        """Create and fill list-of-lists grid.
+
+        Args:
+            initializer: function from `values.py` that draws all values.
+            rng: source of random numbers.
+        """
+        self._grid = initializer(self.width, self.height, self.depth, rng).tolist()
+
+    def _is_filled(self, x, y):
+        """Check whether a cell has been filled.
+
+        Args:
+            x: X-axis coordinate of cell to check.
+            y: Y-axis coordinate of cell to check.
+        """
+        return self._grid[x][y] == 0
+
+    def _mark_filled(self, x, y):
+        """Mark a cell as filled by overwriting its value with 0.
+
+        Args:
+            x: X-axis coordinate of cell to fill.
+            y: Y-axis coordinate of cell to fill.
+        """
+        self._grid[x][y] = 0
 
     def _on_border(self, x, y):
         """Check whether a cell is on the border of the grid.
@@ -178,3 +289,68 @@ class Grid:
         if (y == 0) or (y == self.height - 1):
             return True
         return False
+
+    def _untrap(self, chosen):
+        """Un-fill cells that were trapped when they were chosen.
+
+        Works backward through the fill using union-find with union by
+        size and path halving, which takes O(N α(N)) time for N cells
+        instead of a flood fill per step.
+        Unfilled cells start out joined to their unfilled neighbors,
+        and cells on the border of the grid are joined to an extra
+        "outlet" node. Each chosen cell is then put back, latest first,
+        and joined to its unfilled neighbors and (if on the border) the
+        outlet. That recreates the unfilled region as it was just before
+        the cell was filled, so the cell was trapped if it is not then
+        connected to the outlet.
+
+        Args:
+            chosen: `(x, y, value)` for each chosen cell in order.
+
+        Returns:
+            Set of flat indices of cells un-filled.
+        """
+        width, height = self.width, self.height
+        outlet = width * height
+        parent = list(range(outlet + 1))
+        size = [1] * (outlet + 1)
+        open_cells = bytearray(outlet)
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def union(i, j):
+            i, j = find(i), find(j)
+            if i == j:
+                return
+            if size[i] < size[j]:
+                i, j = j, i
+            parent[j] = i
+            size[i] += size[j]
+
+        def join(x, y):
+            i = x * height + y
+            open_cells[i] = 1
+            if self._on_border(x, y):
+                union(i, outlet)
+            for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+                if (0 <= nx < width) and (0 <= ny < height):
+                    j = nx * height + ny
+                    if open_cells[j]:
+                        union(i, j)
+
+        for x in range(width):
+            for y in range(height):
+                if not self._is_filled(x, y):
+                    join(x, y)
+
+        trapped = set()
+        for x, y, value in reversed(chosen):
+            join(x, y)
+            if find(x * height + y) != find(outlet):
+                self._clear_filled(x, y, value)
+                trapped.add(x * height + y)
+        return trapped
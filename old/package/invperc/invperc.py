@@ -1,24 +1,72 @@
 """Invasion percolation interface."""
 
+import random
+
 from .grid import Grid
+from .lattice import Lattice
+from .masked import MaskedGrid
+
+GRIDS = {
+    "list": Grid,
+    "masked": MaskedGrid,
+}
 
 
-def invperc(width, height, depth):
+def invperc(
+    width,
+    height,
+    depth,
+    frontier="sorted",
+    init="legacy",
+    grid="list",
+    trapping=False,
+    rng=random,
+):
     """Simulate invasion percolation on a grid.
 
     Creates a width X height grid with integer random values in the
     range 1..depth inclusive, fills from the center, and returns the
     resulting `Grid` object. Note that this function does *not*
-    seed Python's `random` module.
+    seed Python's `random` module: seed it first, or pass a seeded
+    `random.Random` object as `rng`.
 
     Args:
         width: X size of grid (positive integer).
         height: Y size of grid (positive integer).
         depth: range of random grid values (positive integer).
+        frontier: how to store candidate cells (see `Grid`).
+        init: how to draw random grid values (see `Grid`).
+        grid: "list" (default) to overwrite filled cells with 0, or
+            "masked" to keep values and record filled cells separately.
+        trapping: whether regions cut off from the border by the
+            filled region can still be filled (see `Grid.fill`).
+        rng: source of random numbers (see `Grid`).
+
+    Returns:
+        A filled instance of `Grid` or one of its subclasses.
+    """
+    assert grid in GRIDS, f"Unknown grid type {grid}"
+    result = GRIDS[grid](width, height, depth, frontier, init, rng)
+    result.fill(trapping)
+    return result
+
+
+def invperc_lattice(shape, depth, frontier="sorted", init="legacy", rng=random):
+    """Simulate invasion percolation on an N-dimensional lattice.
+
+    Like `invperc`, but for a lattice of any shape, such as
+    `(depth, width, height)` for a 3-D medium.
+
+    Args:
+        shape: size of each dimension (tuple of positive integers).
+        depth: range of random grid values (positive integer).
+        frontier: how to store candidate cells (see `Grid`).
+        init: how to draw random grid values (see `Grid`).
+        rng: source of random numbers (see `Grid`).
 
     Returns:
-        A filled instance of `Grid`.
+        A filled instance of `Lattice`.
     """
-    grid = Grid(width, height, depth)
-    grid.fill()
-    return grid
+    result = Lattice(shape, depth, frontier, init, rng)
+    result.fill()
+    return result
@@ -0,0 +1,143 @@
+"""Invasion percolation on N-dimensional lattices using flat indices."""
+
+import math
+import random
+
+import numpy as np
+
+from .frontier import FRONTIERS
+from .values import INITIALIZERS
+
+
+class Lattice:
+    """Represent a rectangular lattice of any number of dimensions.
+
+    Cells are identified by a single integer index into a flattened
+    copy of the lattice with one layer of padding on every side. The
+    padding cells are marked as filled when the lattice is created, so
+    they are never added to the frontier and neighbors can be found by
+    adding precomputed offsets to an index without checking bounds.
+    Each cell has `2 * ndim` neighbors: 4 in 2-D, 6 in 3-D.
+
+    Flat indices are in row-major order, so for a 2-D lattice they sort
+    the same way as `(x, y)` tuples, and a `Lattice` of shape
+    `(width, height)` fills exactly the same cells as a `Grid` of the
+    same size for the same seed and frontier.
+    """
+
+    def __init__(self, shape, depth, frontier="sorted", init="legacy", rng=random):
+        """Construct lattice.
+
+        Args:
+            shape: size of each dimension (tuple of positive integers).
+            depth: range of random grid values (positive integer).
+            frontier: how to store candidate cells (see `Grid`).
+            init: how to draw random grid values (see `Grid`).
+            rng: source of random numbers (see `Grid`).
+        """
+        assert len(shape) > 0, "Lattice must have at least one dimension"
+        assert all(size > 0 for size in shape), f"Invalid shape {shape}"
+        assert frontier in FRONTIERS, f"Unknown frontier {frontier}"
+        assert init in INITIALIZERS, f"Unknown initializer {init}"
+        self._shape = tuple(shape)
+        self._depth = depth
+        self._candidates = FRONTIERS[frontier](depth, rng)
+
+        padded = tuple(size + 2 for size in self._shape)
+        inner = tuple(slice(1, -1) for _ in padded)
+        strides = [math.prod(padded[i + 1 :]) for i in range(len(padded))]
+        self._offsets = [sign * s for s in strides for sign in (-1, 1)]
+
+        values = INITIALIZERS[init](shape[0], math.prod(shape[1:]), depth, rng)
+        self._values = np.zeros(padded, dtype=np.min_scalar_type(depth))
+        self._values[inner] = values.reshape(self._shape)
+        self._filled = np.ones(padded, dtype=bool)
+        self._filled[inner] = False
+        self._border = np.zeros(padded, dtype=bool)
+        self._border[inner] = True
+        self._border[tuple(slice(2, -2) for _ in padded)] = False
+        self._inner = inner
+        self._start = sum((size // 2 + 1) * s for size, s in zip(shape, strides))
+
+        self._value_view = memoryview(self._values.reshape(-1))
+        self._filled_view = memoryview(self._filled.reshape(-1))
+        self._border_view = memoryview(self._border.reshape(-1))
+
+    def __getitem__(self, key):
+        """Get original value at location.
+
+        Args:
+            key: tuple of coordinates, one per dimension.
+
+        Returns:
+            Value at specified location.
+        """
+        return self.values[key]
+
+    def __str__(self):
+        """Create string representation of lattice.
+
+        Returns:
+            `str` showing filled cells as 'X' and empty cells as '.',
+            laid out like `Grid` for 2-D lattices, and as a sequence of
+            2-D slices separated by blank lines for higher dimensions.
+        """
+        return _render(self.filled)
+
+    @property
+    def shape(self):
+        """Size of each dimension."""
+        return self._shape
+
+    @property
+    def depth(self):
+        """Depth of lattice."""
+        return self._depth
+
+    @property
+    def values(self):
+        """Read-only array of original values."""
+        view = self._values[self._inner]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def filled(self):
+        """Read-only boolean array of filled cells."""
+        view = self._filled[self._inner]
+        view.flags.writeable = False
+        return view
+
+    def fill(self):
+        """Fill lattice one cell at a time from the center."""
+        values = self._value_view
+        filled = self._filled_view
+        border = self._border_view
+        offsets = self._offsets
+        candidates = self._candidates
+
+        cell = self._start
+        num_filled = 0
+        while True:
+            filled[cell] = True
+            num_filled += 1
+            if (num_filled > 1) and border[cell]:
+                break
+            for offset in offsets:
+                neighbor = cell + offset
+                if not filled[neighbor]:
+                    candidates.add(values[neighbor], neighbor)
+            cell = candidates.pop()
+        return num_filled
+
+
+def _render(filled):
+    """Show 2-D slices of a boolean array as 'X' and '.'."""
+    if filled.ndim == 1:
+        filled = filled[:, None]
+    if filled.ndim == 2:
+        rows = []
+        for y in range(filled.shape[1] - 1, -1, -1):
+            rows.append("".join("X" if f else "." for f in filled[:, y]))
+        return "\n".join(rows)
+    return "\n\n".join(_render(layer) for layer in filled)
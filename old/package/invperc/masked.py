@@ -0,0 +1,120 @@
+"""Grid that keeps its values and records filled cells separately."""
+
+import numpy as np
+
+from .grid import Grid
+
+
+class MaskedGrid(Grid):
+    """Represent a grid as a read-only value array plus a filled mask.
+
+    `Grid` marks a cell as filled by overwriting its value with 0, so
+    the original values are lost and every cell is a boxed Python
+    integer. This class stores values in a NumPy array of the smallest
+    unsigned type that holds `depth` (one or two bytes per cell) that
+    is never written after construction, and records which cells have
+    been filled in a separate boolean array, so a grid takes two or
+    three bytes per cell and both arrays can be analyzed after filling
+    without copying. Cells are read and written during filling through
+    memoryviews, which is about as fast as indexing nested lists.
+
+    Indexing returns the original value of a cell whether or not it
+    has been filled; use `filled` to find out which cells have been.
+    """
+
+    def __getitem__(self, key):
+        """Get value at location.
+
+        Args:
+            key: 2-tuple of (x, y) coordinates.
+
+        Returns:
+            Original value at specified location.
+        """
+        return self._value_view[key]
+
+    def __setitem__(self, key, value):
+        """Values cannot be changed after construction."""
+        raise TypeError("MaskedGrid values are read-only")
+
+    def __eq__(self, other):
+        """Check equality of this grid with another.
+
+        Args:
+            other: the other grid to check
+
+        Returns:
+            `True` if grids are the same size with equal values and
+            the same cells filled, `False` otherwise.
+        """
+        if not isinstance(other, MaskedGrid):
+            return super().__eq__(other)
+        return np.array_equal(self._values, other._values) and np.array_equal(
+            self._filled, other._filled
+        )
+
+    @property
+    def values(self):
+        """Read-only array of original values indexed by `[x, y]`."""
+        return self._values
+
+    @property
+    def filled(self):
+        """Read-only boolean array of filled cells indexed by `[x, y]`."""
+        view = self._filled.view()
+        view.flags.writeable = False
+        return view
+
+    def to_array(self):
+        """Get contents as a NumPy array.
+
+        Returns:
+            Integer array indexed by `[x, y]` with 0 for filled cells,
+            like `Grid`.
+        """
+        return np.where(self._filled, 0, self._values).astype(np.int64)
+
+    def _init_grid(self, initializer, rng):
+        """Create value array and empty filled mask.
+
+        Args:
+            initializer: function from `values.py` that draws all values.
+            rng: source of random numbers.
+        """
+        assert self.depth < 2**16, f"Depth {self.depth} too large for MaskedGrid"
+        dtype = np.uint8 if self.depth < 2**8 else np.uint16
+        self._values = initializer(self.width, self.height, self.depth, rng).astype(
+            dtype
+        )
+        self._values.flags.writeable = False
+        self._filled = np.zeros((self.width, self.height), dtype=bool)
+        self._value_view = memoryview(self._values)
+        self._filled_view = memoryview(self._filled)
+
+    def _is_filled(self, x, y):
+        """Check whether a cell has been filled.
+
+        Args:
+            x: X-axis coordinate of cell to check.
+            y: Y-axis coordinate of cell to check.
+        """
+        return self._filled_view[x, y]
+
+    def _mark_filled(self, x, y):
+        """Mark a cell as filled.
+
+        Args:
+            x: X-axis coordinate of cell to fill.
+            y: Y-axis coordinate of cell to fill.
+        """
+        self._filled_view[x, y] = True
+
+    def _clear_filled(self, x, y, value):
+        """Mark a cell as unfilled.
+
+        Args:
+            x: X-axis coordinate of cell to clear.
+            y: Y-axis coordinate of cell to clear.
+            value: original value of cell (ignored).
+        """
+        self._filled_view[x, y] = False
@@ -0,0 +1,139 @@
+"""Profiling support for command-line runs.
+
+A `Profiler` times each phase of a run (such as "init", "fill", and
+"output") and, for the phases it is asked to profile, records both
+`cProfile` statistics and a sampled call stack of the main thread.
+`save` writes three files with a common prefix:
+
+-   `PREFIX.pstats`: `cProfile` statistics for use with `pstats` or
+    viewers such as `snakeviz`.
+-   `PREFIX.folded`: one line per distinct stack, with frames from
+    outermost to innermost separated by ';' and followed by the number
+    of samples, which is the input format for flame graph tools such
+    as `flamegraph.pl` and `speedscope`.
+-   `PREFIX.json`: wall-clock time of every phase in seconds and the
+    number of stack samples taken.
+
+Stacks are sampled by a background thread, which can only run when the
+main thread releases the GIL, so the effective sampling interval is at
+least `sys.getswitchinterval()` (5 ms by default).
+"""
+
+import cProfile
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+PHASES = ("init", "fill", "output")
+INTERVAL = 0.001  # seconds between stack samples
+OVERHEAD = {__name__, "contextlib"}  # modules whose frames are not sampled
+
+
+class Profiler:
+    """Time phases of a run and profile some of them."""
+
+    def __init__(self, prefix=None, phases=PHASES, interval=INTERVAL):
+        """Construct profiler.
+
+        Args:
+            prefix: path prefix for output files, or `None` to do nothing.
+            phases: names of phases to profile (others are only timed).
+            interval: seconds between stack samples.
+        """
+        self._prefix = prefix
+        self._phases = set(phases)
+        self._interval = interval
+        self._timings = {}
+        self._profile = cProfile.Profile()
+        self._samples = Counter()
+
+    @contextmanager
+    def phase(self, name):
+        """Time (and possibly profile) the body of a `with` block.
+
+        Args:
+            name: name of phase.
+        """
+        if self._prefix is None:
+            yield
+            return
+        sampler = None
+        if name in self._phases:
+            sampler = _Sampler(threading.get_ident(), self._interval, self._samples)
+            sampler.start()
+            self._profile.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._timings[name] = self._timings.get(name, 0.0) + (
+                time.perf_counter() - start
+            )
+            if sampler is not None:
+                self._profile.disable()
+                sampler.stop()
+
+    def save(self):
+        """Write statistics, collapsed stacks, and phase timings."""
+        if self._prefix is None:
+            return
+        prefix = Path(self._prefix)
+        prefix.parent.mkdir(parents=True, exist_ok=True)
+        self._profile.dump_stats(f"{prefix}.pstats")
+        with open(f"{prefix}.folded", "w") as writer:
+            for stack, count in sorted(self._samples.items()):
+                writer.write(f"{stack} {count}\n")
+        summary = {
+            "phases": self._timings,
+            "profiled": sorted(self._phases),
+            "interval": self._interval,
+            "samples": sum(self._samples.values()),
+        }
+        with open(f"{prefix}.json", "w") as writer:
+            json.dump(summary, writer, indent=4)
+            writer.write("\n")
+
+
+class _Sampler(threading.Thread):
+    """Background thread that records the stack of another thread."""
+
+    def __init__(self, target_id, interval, samples):
+        super().__init__(daemon=True)
+        self._target_id = target_id
+        self._interval = interval
+        self._samples = samples
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(self._interval):
+            frame = sys._current_frames().get(self._target_id)
+            if (frame is not None) and not _in_profiler(frame):
+                self._samples[_collapse(frame)] += 1
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+def _in_profiler(frame):
+    """Is a stack inside this module or `contextlib` (e.g., leaving a phase)?"""
+    while frame is not None:
+        if frame.f_globals.get("__name__") in OVERHEAD:
+            return True
+        frame = frame.f_back
+    return False
+
+
+def _collapse(frame):
+    """Describe a stack from outermost to innermost frame."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        filename = Path(code.co_filename).name
+        names.append(f"{code.co_name} ({filename}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(name.replace(";", ":") for name in reversed(names))
@@ -0,0 +1,87 @@
+"""Random initial values for invasion percolation grids.
+
+Each initializer takes a width, height, depth, and source of random
+numbers (the `random` module by default, or a `random.Random` object),
+and returns a NumPy array of shape `(width, height)` with integer values
+in 1..depth, drawn in a single vectorized step rather than one
+`random.randint` per cell.
+
+Use "legacy" when results must match the original cell-by-cell loop
+for a given seed: it produces exactly the same values and leaves the
+`random` module in exactly the same state. Use "numpy" when they do not
+have to; it is faster, and is seeded from `random` so that `--seed`
+still makes runs reproducible.
+"""
+
+import random
+
+import numpy as np
+
+# Bits in one word of the Mersenne Twister behind `random`.
+WORD_BITS = 32
+
+
+def legacy_values(width, height, depth, rng=random):
+    """Reproduce `random.randint(1, depth)` for each cell in x-major order.
+
+    `randint` draws `k = depth.bit_length()` bits at a time by taking the
+    top `k` bits of one 32-bit word from the generator, and rejects the
+    result if it is not less than `depth`. `getrandbits(32 * n)` returns
+    the next `n` words packed little-endian into one integer, so this
+    function draws a block of words, applies the same shift and rejection
+    to all of them at once, and then rewinds and advances the generator
+    by exactly the number of words the loop would have used.
+
+    Args:
+        width: X size of grid (positive integer).
+        height: Y size of grid (positive integer).
+        depth: range of random grid values (positive integer).
+        rng: source of random numbers.
+
+    Returns:
+        Array of shape `(width, height)`.
+    """
+    count = width * height
+    bits = depth.bit_length()
+    if (count == 0) or (bits > WORD_BITS):
+        values = [rng.randint(1, depth) for _ in range(count)]
+        return np.array(values, dtype=np.int64).reshape(width, height)
+
+    state = rng.getstate()
+    num_words = count + count // 2 + 16  # at least half of all draws succeed
+    while True:
+        packed = rng.getrandbits(WORD_BITS * num_words)
+        raw = packed.to_bytes(4 * num_words, "little")
+        draws = np.frombuffer(raw, dtype="<u4") >> (WORD_BITS - bits)
+        accepted = np.flatnonzero(draws < depth)
+        if len(accepted) >= count:
+            break
+        rng.setstate(state)
+        num_words *= 2
+
+    rng.setstate(state)
+    rng.getrandbits(WORD_BITS * (int(accepted[count - 1]) + 1))
+    values = 1 + draws[accepted[:count]].astype(np.int64)
+    return values.reshape(width, height)
+
+
+def numpy_values(width, height, depth, rng=random):
+    """Draw values with a NumPy generator seeded from `rng`.
+
+    Args:
+        width: X size of grid (positive integer).
+        height: Y size of grid (positive integer).
+        depth: range of random grid values (positive integer).
+        rng: source of random numbers.
+
+    Returns:
+        Array of shape `(width, height)`.
+    """
+    generator = np.random.default_rng(rng.getrandbits(64))
+    return generator.integers(1, depth + 1, size=(width, height), dtype=np.int64)
+
+
+INITIALIZERS = {
+    "legacy": legacy_values,
+    "numpy": numpy_values,
+}
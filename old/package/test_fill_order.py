@@ -0,0 +1,52 @@
+import random
+
+import numpy as np
+import pytest
+from invperc.grid import Grid
+from invperc.masked import MaskedGrid
+
+
+def final_filled(grid):
+    return np.array(
+        [[grid._is_filled(x, y) for y in range(grid.height)] for x in range(grid.width)]
+    )
+
+
+@pytest.mark.parametrize("cls", [Grid, MaskedGrid])
+@pytest.mark.parametrize("trapping", [False, True])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_fill_order_replays_to_final_state(cls, trapping, seed):
+    random.seed(seed)
+    fixture = cls(21, 15, 3)
+    num_filled = fixture.fill(trapping)
+    order = fixture.fill_order
+    assert order.itemsize == 4
+    assert len(order) == num_filled
+    assert len(set(order)) == num_filled
+    assert order[0] == 10 * 15 + 7
+    assert not fixture.filled_at(0).any()
+    assert np.array_equal(fixture.filled_at(num_filled), final_filled(fixture))
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_each_step_fills_one_cell_next_to_region(seed):
+    random.seed(seed)
+    fixture = Grid(15, 11, 4)
+    fixture.fill()
+    for step in range(2, len(fixture.fill_order) + 1):
+        before, after = fixture.filled_at(step - 1), fixture.filled_at(step)
+        assert after.sum() == step
+        (x,), (y,) = np.nonzero(after & ~before)
+        assert any(
+            before[x + dx, y + dy]
+            for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1))
+            if (0 <= x + dx < 15) and (0 <= y + dy < 11)
+        )
+
+
+def test_filled_at_out_of_range():
+    random.seed(1)
+    fixture = Grid(5, 5, 2)
+    fixture.fill()
+    with pytest.raises(AssertionError):
+        fixture.filled_at(len(fixture.fill_order) + 1)
@@ -0,0 +1,105 @@
+import random
+
+import pytest
+from invperc.frontier import FRONTIERS, RandomBuckets, SortedBuckets
+from invperc.grid import Grid
+from invperc.invperc import invperc
+
+# Output of the original set-based implementation for an 11x9 grid of depth 5.
+LEGACY = {
+    1: """\
+...........
+.XX........
+..XX.......
+..X..X.....
+..XXXX.....
+XXX.XX.....
+...XXXX....
+....XX.....
+...........
+""",
+    2: """\
+...X.......
+...X.......
+...X.......
+...XXX.....
+..XX.X.....
+.XX..XX....
+...........
+...........
+...........
+""",
+    3: """\
+....X......
+....X......
+.X..X......
+.XXXXX.....
+..XX.X.....
+..XX.X.....
+.....X.....
+...........
+...........
+""",
+}
+
+
+@pytest.mark.parametrize("seed", sorted(LEGACY))
+def test_sorted_frontier_matches_original(seed):
+    random.seed(seed)
+    assert str(invperc(11, 9, 5, "sorted")) + "\n" == LEGACY[seed]
+
+
+@pytest.mark.parametrize("frontier", sorted(FRONTIERS))
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_fill_reaches_border_through_connected_region(frontier, seed):
+    random.seed(seed)
+    grid = invperc(15, 11, 5, frontier)
+    filled = {
+        (x, y) for x in range(grid.width) for y in range(grid.height) if grid[x, y] == 0
+    }
+    assert any(
+        (x in (0, grid.width - 1)) or (y in (0, grid.height - 1)) for x, y in filled
+    )
+    start = (grid.width // 2, grid.height // 2)
+    seen, todo = {start}, [start]
+    while todo:
+        x, y = todo.pop()
+        for cell in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if (cell in filled) and (cell not in seen):
+                seen.add(cell)
+                todo.append(cell)
+    assert seen == filled
+
+
+@pytest.mark.parametrize("cls", [SortedBuckets, RandomBuckets])
+def test_frontier_pops_lowest_value_without_duplicates(cls):
+    frontier = cls(5)
+    for value, cell in [(3, (0, 0)), (1, (1, 1)), (3, (2, 2)), (1, (1, 1))]:
+        frontier.add(value, cell)
+    assert len(frontier) == 3
+    assert frontier.pop() == (1, 1)
+    assert {frontier.pop(), frontier.pop()} == {(0, 0), (2, 2)}
+    assert len(frontier) == 0
+
+
+@pytest.mark.parametrize("cls", [SortedBuckets, RandomBuckets])
+def test_frontier_cost_independent_of_depth(cls):
+    frontier = cls(10**18)
+    for value, cell in [(10**18, (0, 0)), (5, (1, 1)), (10**12, (2, 2))]:
+        frontier.add(value, cell)
+    assert [frontier.pop() for _ in range(3)] == [(1, 1), (2, 2), (0, 0)]
+
+
+def test_large_depth_fills_same_cells_with_either_frontier():
+    # With a billion values, ties are (almost) impossible, so both
+    # frontiers must fill exactly the same cells.
+    results = []
+    for frontier in sorted(FRONTIERS):
+        random.seed(4)
+        results.append(str(invperc(31, 31, 10**9, frontier)))
+    assert results[0] == results[1]
+
+
+def test_unknown_frontier_rejected():
+    with pytest.raises(AssertionError):
+        Grid(5, 5, 3, "nonexistent")
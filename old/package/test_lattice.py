@@ -0,0 +1,59 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+from invperc.grid import Grid
+from invperc.lattice import Lattice
+from invperc.values import legacy_values
+
+
+@pytest.mark.parametrize("frontier", ["sorted", "bucket"])
+@pytest.mark.parametrize("seed", [1, 2, 3, 4])
+def test_2d_lattice_matches_grid(frontier, seed):
+    random.seed(seed)
+    expected = Grid(21, 17, 5, frontier)
+    expected_num = expected.fill()
+    random.seed(seed)
+    actual = Lattice((21, 17), 5, frontier)
+    assert actual.fill() == expected_num
+    assert str(actual) == str(expected)
+
+
+@pytest.mark.parametrize("frontier", ["sorted", "bucket"])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_3d_lattice_fills_connected_region_to_border(frontier, seed):
+    shape = (9, 11, 7)
+    random.seed(seed)
+    original = legacy_values(9, 11 * 7, 4).reshape(shape)
+    random.seed(seed)
+    fixture = Lattice(shape, 4, frontier)
+    num_filled = fixture.fill()
+
+    filled = {tuple(int(i) for i in cell) for cell in np.argwhere(fixture.filled)}
+    assert len(filled) == num_filled
+    assert np.array_equal(fixture.values, original)
+    assert any(
+        any(c in (0, size - 1) for c, size in zip(cell, shape)) for cell in filled
+    )
+
+    start = tuple(size // 2 for size in shape)
+    seen, todo = {start}, [start]
+    while todo:
+        cell = todo.pop()
+        for axis, step in itertools.product(range(3), (-1, 1)):
+            neighbor = list(cell)
+            neighbor[axis] += step
+            neighbor = tuple(neighbor)
+            if (neighbor in filled) and (neighbor not in seen):
+                seen.add(neighbor)
+                todo.append(neighbor)
+    assert seen == filled
+
+
+def test_1d_lattice_fills_to_an_end():
+    random.seed(5)
+    fixture = Lattice((9,), 3)
+    fixture.fill()
+    assert fixture.filled[0] or fixture.filled[-1]
+    assert fixture.filled[4]
@@ -0,0 +1,58 @@
+import random
+
+import numpy as np
+import pytest
+from invperc.grid import Grid
+from invperc.masked import MaskedGrid
+from invperc.values import legacy_values
+
+
+@pytest.mark.parametrize("frontier", ["sorted", "bucket"])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_masked_fill_matches_list_fill_and_keeps_values(frontier, seed):
+    random.seed(seed)
+    original = legacy_values(17, 13, 5)
+    random.seed(seed)
+    expected = Grid(17, 13, 5, frontier)
+    expected_num = expected.fill()
+    random.seed(seed)
+    actual = MaskedGrid(17, 13, 5, frontier)
+    assert actual.fill() == expected_num
+    assert str(actual) == str(expected)
+    cells = [[expected[x, y] for y in range(13)] for x in range(17)]
+    assert actual.filled.tolist() == (np.array(cells) == 0).tolist()
+    assert actual.values.tolist() == original.tolist()
+
+
+@pytest.mark.parametrize("depth, dtype", [(10, np.uint8), (1000, np.uint16)])
+def test_masked_values_read_only_and_compact(depth, dtype):
+    fixture = MaskedGrid(6, 4, depth)
+    assert fixture.values.dtype == dtype
+    fixture.fill()
+    with pytest.raises(ValueError):
+        fixture.values[0, 0] = 1
+    with pytest.raises(ValueError):
+        fixture.filled[0, 0] = True
+    with pytest.raises(TypeError):
+        fixture[0, 0] = 1
+
+
+def test_masked_depth_too_large():
+    with pytest.raises(AssertionError):
+        MaskedGrid(3, 3, 2**16)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_masked_and_list_grids_equal_with_same_digest(seed):
+    random.seed(seed)
+    expected = Grid(19, 14, 6)
+    expected.fill()
+    random.seed(seed)
+    actual = MaskedGrid(19, 14, 6)
+    actual.fill()
+    assert actual == expected
+    assert expected == actual
+    assert actual.digest() == expected.digest()
+    expected[0, 0] = 0
+    assert actual != expected
+    assert actual.digest() != expected.digest()
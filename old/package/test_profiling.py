@@ -0,0 +1,37 @@
+import json
+import pstats
+import random
+
+from invperc.grid import Grid
+from invperc.profiling import Profiler
+
+
+def test_profiler_writes_stats_stacks_and_timings(tmp_path):
+    prefix = tmp_path / "run"
+    profiler = Profiler(prefix, phases=["fill"], interval=0.0001)
+    random.seed(1)
+    with profiler.phase("init"):
+        grid = Grid(301, 301, 2, "bucket")
+    with profiler.phase("fill"):
+        grid.fill()
+    profiler.save()
+
+    summary = json.loads((tmp_path / "run.json").read_text())
+    assert set(summary["phases"]) == {"init", "fill"}
+    assert summary["profiled"] == ["fill"]
+
+    functions = {f for (_, _, f) in pstats.Stats(str(tmp_path / "run.pstats")).stats}
+    assert "_choose_cell" in functions
+    assert "_init_grid" not in functions
+
+    lines = (tmp_path / "run.folded").read_text().splitlines()
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == summary["samples"]
+    assert all("fill (grid.py" in line for line in lines)
+
+
+def test_profiler_without_prefix_does_nothing(tmp_path):
+    profiler = Profiler()
+    with profiler.phase("fill"):
+        pass
+    profiler.save()
+    assert list(tmp_path.iterdir()) == []
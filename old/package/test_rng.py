@@ -0,0 +1,46 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from invperc.invperc import invperc, invperc_lattice
+
+CONFIGS = [
+    {"frontier": "sorted", "init": "legacy", "grid": "list"},
+    {"frontier": "bucket", "init": "numpy", "grid": "masked"},
+    {"frontier": "bucket", "init": "legacy", "grid": "list", "trapping": True},
+]
+
+
+def run(config, seed, rng=None):
+    if rng is None:
+        random.seed(seed)
+        grid = invperc(21, 17, 5, **config)
+    else:
+        grid = invperc(21, 17, 5, **config, rng=rng)
+    return grid.digest(), list(grid.fill_order)
+
+
+@pytest.mark.parametrize("config", CONFIGS)
+def test_injected_rng_matches_global_random(config):
+    expected = run(config, 4321)
+    random.seed(999)
+    assert run(config, None, random.Random(4321)) == expected
+    assert random.random() == random.Random(999).random()
+
+
+@pytest.mark.parametrize("config", CONFIGS)
+def test_concurrent_grids_independent(config):
+    seeds = [11, 22, 33, 44]
+    expected = [run(config, seed, random.Random(seed)) for seed in seeds]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        actual = list(
+            executor.map(lambda seed: run(config, seed, random.Random(seed)), seeds)
+        )
+    assert actual == expected
+
+
+def test_lattice_injected_rng_matches_global_random():
+    random.seed(77)
+    expected = invperc_lattice((7, 9, 5), 4, "bucket").filled.tobytes()
+    actual = invperc_lattice((7, 9, 5), 4, "bucket", rng=random.Random(77))
+    assert actual.filled.tobytes() == expected
@@ -0,0 +1,95 @@
+import random
+
+import pytest
+from invperc.grid import Grid
+from invperc.masked import MaskedGrid
+
+
+def distinct_grid(width, height, seed):
+    """Grid whose values are a random permutation of 1..width*height."""
+    grid = Grid(width, height, width * height)
+    values = list(range(1, width * height + 1))
+    random.Random(seed).shuffle(values)
+    for x in range(width):
+        for y in range(height):
+            grid[x, y] = values[x * height + y]
+    return grid
+
+
+def reference_trapping(grid):
+    """Fill with trapping by flood-filling the unfilled region every step."""
+    width, height = grid.width, grid.height
+    values = {(x, y): grid[x, y] for x in range(width) for y in range(height)}
+
+    def neighbors(x, y):
+        for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if (0 <= nx < width) and (0 <= ny < height):
+                yield nx, ny
+
+    def on_border(x, y):
+        return (x in (0, width - 1)) or (y in (0, height - 1))
+
+    filled = {(width // 2, height // 2)}
+    while True:
+        todo = [cell for cell in values if on_border(*cell) and cell not in filled]
+        escaped = set(todo)
+        while todo:
+            for cell in neighbors(*todo.pop()):
+                if (cell not in filled) and (cell not in escaped):
+                    escaped.add(cell)
+                    todo.append(cell)
+        candidates = {
+            cell
+            for f in filled
+            for cell in neighbors(*f)
+            if (cell not in filled) and (cell in escaped)
+        }
+        choice = min(candidates, key=values.get)
+        filled.add(choice)
+        if on_border(*choice):
+            return filled
+
+
+def filled_cells(grid):
+    return {
+        (x, y)
+        for x in range(grid.width)
+        for y in range(grid.height)
+        if grid._is_filled(x, y)
+    }
+
+
+@pytest.mark.parametrize("size", [(5, 5), (9, 7), (15, 15), (21, 13)])
+@pytest.mark.parametrize("seed", range(10))
+def test_trapping_matches_reference(size, seed):
+    fixture = distinct_grid(*size, seed)
+    expected = reference_trapping(fixture)
+    num_filled = fixture.fill(trapping=True)
+    assert filled_cells(fixture) == expected
+    assert num_filled == len(expected)
+
+
+def test_trapping_fills_no_more_than_plain_and_restores_values():
+    num_trapped = 0
+    for seed in range(20):
+        plain = distinct_grid(15, 15, seed)
+        plain_num = plain.fill()
+        trapped = distinct_grid(15, 15, seed)
+        original = distinct_grid(15, 15, seed)
+        trapped_num = trapped.fill(trapping=True)
+        assert filled_cells(trapped) <= filled_cells(plain)
+        for x, y in filled_cells(plain) - filled_cells(trapped):
+            assert trapped[x, y] == original[x, y]
+        num_trapped += plain_num - trapped_num
+    assert num_trapped > 0
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_trapping_same_for_masked_grid(seed):
+    random.seed(seed)
+    expected = Grid(25, 25, 3)
+    expected_num = expected.fill(trapping=True)
+    random.seed(seed)
+    actual = MaskedGrid(25, 25, 3)
+    assert actual.fill(trapping=True) == expected_num
+    assert str(actual) == str(expected)
@@ -0,0 +1,33 @@
+import random
+
+import numpy as np
+import pytest
+from invperc.values import INITIALIZERS, legacy_values
+
+
+def loop_values(width, height, depth):
+    return [[random.randint(1, depth) for y in range(height)] for x in range(width)]
+
+
+@pytest.mark.parametrize("depth", [1, 2, 5, 7, 10, 100, 2**31 + 1, 2**40])
+@pytest.mark.parametrize("width, height", [(1, 1), (11, 9), (64, 33)])
+def test_legacy_values_match_loop_and_leave_same_state(width, height, depth):
+    random.seed(8675309)
+    expected = loop_values(width, height, depth)
+    expected_state = random.getstate()
+    random.seed(8675309)
+    actual = legacy_values(width, height, depth)
+    assert actual.tolist() == expected
+    assert random.getstate() == expected_state
+
+
+@pytest.mark.parametrize("init", sorted(INITIALIZERS))
+def test_values_in_range_and_reproducible(init):
+    random.seed(12345)
+    first = INITIALIZERS[init](20, 30, 6)
+    random.seed(12345)
+    second = INITIALIZERS[init](20, 30, 6)
+    assert first.shape == (20, 30)
+    assert first.min() >= 1
+    assert first.max() <= 6
+    assert np.array_equal(first, second)